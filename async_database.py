@@ -0,0 +1,168 @@
+import asyncpg
+import logging
+from database import _load_config, _store_lookups, _LOOKUPS_SQL, _SESSION_SETTINGS, _TYPE_IDS
+
+logger = logging.getLogger(__name__)
+
+# Errors handled by the `AsyncDatabase` methods: failed statements, and connections that are closed or cannot
+# be established, which asyncpg reports with an `InterfaceError` or an `OSError` rather than a `PostgresError`.
+_DATABASE_ERRORS = (asyncpg.PostgresError, asyncpg.InterfaceError, OSError)
+
+
+class AsyncDatabase:
+    """
+    This module defines the `AsyncDatabase` class, an `asyncpg`-based counterpart of `Database` for services
+    that handle many concurrent users (e.g. a web backend).
+
+    The `AsyncDatabase` class includes asynchronous versions of the request-path methods:
+    - Retrieve a user, add a transaction, calculate totals and check transaction ownership.
+
+    Usage:
+    - It reads the same connection parameters (`DB_NAME`, `DB_USER`, `DB_PASSWORD`, `DB_HOST`, `DB_PORT`) as `Database`.
+    - Await `connect` once before using the other methods and `close` at shutdown.
+    - The schema is still created with the synchronous `Database.db_init`.
+    """
+    def __init__(self):
+        """
+        Initializes an AsyncDatabase instance.
+
+        Attributes:
+            _cfg (SimpleNamespace): The connection parameters shared with `Database`.
+            _pool (asyncpg.Pool or None): The connection pool, initially set to `None`.
+        """
+
+        self._cfg = _load_config()
+        self._pool = None
+
+    async def connect(self):
+        """
+        Creates the connection pool.
+
+        asyncpg caches the prepared statement of every query on each pooled connection, so repeated
+        calls skip parsing and planning on the server without an explicit `PREPARE`. The connections
+        get the same statement and idle-in-transaction timeouts as the pool of `Database`.
+        """
+        self._pool = await asyncpg.create_pool(
+            database=self._cfg.dbname,
+            user=self._cfg.user,
+            password=self._cfg.password,
+            host=self._cfg.host,
+            port=self._cfg.port,
+            min_size=2,
+            max_size=20,
+            statement_cache_size=100,
+            server_settings=_SESSION_SETTINGS)
+
+    async def close(self):
+        """
+        Closes all connections held by the pool.
+        """
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def get_user(self, username):
+        """
+        Retrieves a user's data from the database based on their username.
+
+        Args:
+        - username (str): The username of the user to retrieve.
+
+        Returns:
+        - dict or None: A dictionary with keys 'user_id', 'username', 'password', and 'email'
+          containing the user's data, or None if the user does not exist or if a database error occurs.
+        """
+        try:
+            async with self._pool.acquire() as connection:
+                user = await connection.fetchrow(
+                    'SELECT user_id, username, password, email FROM users WHERE username = $1;', username)
+                return dict(user) if user else None
+        except _DATABASE_ERRORS:
+            logger.exception('A database error has occurred while retrieving the user %s.', username)
+            return None
+
+    async def add_transaction(self, user_id, amount, category, description, date, type_of_transaction):
+        """
+        Add a transaction to the database.
+
+        Args:
+            user_id (int): The ID of the user associated with the transaction.
+            amount (Decimal): The amount of the transaction (must be a positive value).
+            category (int): The transaction category, represented as an integer.
+            description (str): A brief description of the transaction.
+            date (datetime): The transaction date.
+            type_of_transaction (int): The type of transaction, where 1 represents Income and 2 represents Expense.
+
+        Returns:
+            int or None: The `transaction_id` of the new transaction, like `Database.add_transaction`,
+                         or `None` if an error occurs.
+        """
+        try:
+            async with self._pool.acquire() as connection:
+                return await connection.fetchval(
+                    '''INSERT INTO transactions (user_id, amount, category, description, date, type)
+                    VALUES ($1, $2, $3, $4, $5, $6) RETURNING transaction_id;''',
+                    user_id, amount, category, description, date, type_of_transaction)
+        except _DATABASE_ERRORS:
+            logger.exception('Failed to add transaction to database.')
+            return None
+
+    async def type_id(self, name):
+        """
+        Returns the id of a transaction type, like `Database.type_id`.
+
+        The lookup tables are shared with `Database`, so they are loaded from the database only if
+        neither class has loaded them yet in this process.
+
+        Args:
+            name (str): The name of the transaction type, 'Income' or 'Expense'.
+
+        Returns:
+            int or None: The `type_id` of the transaction type, or None if there is no such type.
+        """
+        if not _TYPE_IDS:
+            async with self._pool.acquire() as connection:
+                _store_lookups(await connection.fetch(_LOOKUPS_SQL))
+        return _TYPE_IDS.get(name)
+
+    async def totals(self, user_id):
+        """
+        Calculates the total income and total expenses of a user in a single query.
+
+        Args:
+            user_id (int): The ID of the user whose totals are to be calculated.
+
+        Returns:
+            dict: A dictionary mapping the transaction type id to its total amount. The 'Income' and
+                  'Expense' types (see `type_id`) default to 0 when they have no transactions.
+        """
+        totals = {}
+        try:
+            totals = {await self.type_id('Income'): 0, await self.type_id('Expense'): 0}
+            async with self._pool.acquire() as connection:
+                rows = await connection.fetch(
+                    'SELECT type, SUM(amount) FROM transactions WHERE user_id = $1 GROUP BY type;', user_id)
+                totals.update((row[0], row[1]) for row in rows)
+        except _DATABASE_ERRORS:
+            logger.exception('Database error occurred.')
+        return totals
+
+    async def check_if_eligible(self, user_id, transaction_id):
+        """
+        Checks if a user is eligible to modify or delete a specific transaction.
+
+        Args:
+            user_id (int): The ID of the user attempting to access the transaction.
+            transaction_id (int): The ID of the transaction to verify.
+
+        Returns:
+            bool: `True` if the `user_id` is associated with the given `transaction_id`, `False` otherwise.
+        """
+        try:
+            async with self._pool.acquire() as connection:
+                return await connection.fetchval(
+                    'SELECT EXISTS(SELECT 1 FROM transactions WHERE transaction_id = $1 AND user_id = $2);',
+                    transaction_id, user_id)
+        except _DATABASE_ERRORS:
+            logger.exception('Error during checking the eligibility')
+            return False
@@ -1,8 +1,306 @@
 import psycopg2
+from psycopg2 import errors
+from psycopg2.extensions import make_dsn, new_type, register_type, DECIMAL, TRANSACTION_STATUS_IDLE
+from psycopg2.extras import execute_values, RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool, PoolError
+from contextlib import contextmanager
+from io import StringIO
+from collections import OrderedDict
+from threading import Lock, local
+from time import monotonic
 from dotenv import load_dotenv
+from types import SimpleNamespace
+from functools import lru_cache, wraps
+import logging
 import os
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+# Session settings sent with every connection. A runaway query cannot hold a pool slot for more than five seconds,
+# and a session left idle inside a transaction is terminated by the server instead of keeping its locks.
+# `AsyncDatabase` applies the same settings to its own pool.
+_SESSION_SETTINGS = {'statement_timeout': '5000', 'idle_in_transaction_session_timeout': '10000'}
+_SESSION_OPTIONS = ' '.join(f'-c {name}={value}' for name, value in _SESSION_SETTINGS.items())
+
+
+@lru_cache(maxsize=1)
+def _load_config():
+    """
+    Reads the connection parameters once, on first use, instead of at import time.
+
+    The `.env` file is parsed unless `ENV_LOADED=1` is set (e.g. by a container orchestrator). It only fills in
+    variables that are missing from the environment, never overriding the ones already set.
+
+    Returns:
+        SimpleNamespace: The connection parameters (`dbname`, `user`, `password`, `host`, `port`) and `dsn`,
+                         the libpq connection string built from them once for every pooled connection.
+    """
+    if os.getenv('ENV_LOADED') != '1':
+        load_dotenv()
+    cfg = SimpleNamespace(
+        dbname=os.getenv('DB_NAME'),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        host=os.getenv('DB_HOST'),
+        port=os.getenv('DB_PORT'))
+    # Unset variables are left out, so that libpq falls back to its own defaults instead of receiving `None`.
+    params = {key: value for key, value in vars(cfg).items() if value is not None}
+    cfg.dsn = make_dsn(
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=3,
+        connect_timeout=5,
+        options=_SESSION_OPTIONS,
+        **params)
+    return cfg
+
+
+# Schema and seed data created by `Database.db_init` in a single round trip. Losing this commit in a crash
+# is harmless (the next start simply runs it again), so it does not wait for the WAL flush. `ANALYZE` of a large
+# table may take longer than the session's statement timeout, which is lifted for this transaction.
+_SCHEMA_SQL = '''
+SET LOCAL synchronous_commit = off;
+SET LOCAL statement_timeout = 0;
+CREATE TABLE IF NOT EXISTS users(
+        user_id serial PRIMARY KEY,
+        username VARCHAR(50) UNIQUE NOT NULL,
+        password BYTEA NOT NULL,
+        email VARCHAR(100) UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS categories(
+        category_id serial PRIMARY KEY,
+        category_name VARCHAR(255));
+CREATE TABLE IF NOT EXISTS types(
+        type_id serial PRIMARY KEY,
+        type_name VARCHAR(10));
+CREATE TABLE IF NOT EXISTS transactions(
+        transaction_id serial PRIMARY KEY,
+        user_id INTEGER REFERENCES users(user_id),
+        amount DECIMAL,
+        category INTEGER REFERENCES categories(category_id),
+        description TEXT,
+        date DATE NOT NULL,
+        type INTEGER REFERENCES types(type_id));
+CREATE INDEX IF NOT EXISTS idx_tx_user_type ON transactions(user_id, type) INCLUDE (amount);
+CREATE INDEX IF NOT EXISTS idx_tx_user_date ON transactions(user_id, date DESC);
+CREATE INDEX IF NOT EXISTS idx_tx_user_category ON transactions(user_id, category);
+INSERT INTO categories (category_name)
+        SELECT * FROM (VALUES ('Food'), ('Transportation'), ('Utilities'), ('Entertainment'), ('Health'), ('Account')) AS seed
+        WHERE NOT EXISTS (SELECT 1 FROM categories);
+INSERT INTO types (type_name)
+        SELECT * FROM (VALUES ('Income'), ('Expense')) AS seed
+        WHERE NOT EXISTS (SELECT 1 FROM types);
+ANALYZE categories, types, transactions;
+'''
+
+# Hot statements prepared once per pooled connection, so the server parses and plans them only once.
+_PREPARE_SQL = '''
+DEALLOCATE ALL;
+PREPARE get_user_stmt(text) AS
+        SELECT user_id, username, password, email FROM users WHERE username = $1;
+PREPARE add_transaction_stmt(integer, numeric, integer, text, date, integer) AS
+        INSERT INTO transactions (user_id, amount, category, description, date, type)
+        VALUES ($1, $2, $3, $4, $5, $6) RETURNING transaction_id;
+PREPARE check_eligible_stmt(integer, integer) AS
+        SELECT EXISTS(SELECT 1 FROM transactions WHERE transaction_id = $1 AND user_id = $2);
+PREPARE totals_stmt(integer) AS
+        SELECT type, SUM(amount) FROM transactions WHERE user_id = $1 GROUP BY type;
+'''
+
+# Statements run by the `Database` methods, kept on a single line each so that no indentation is sent to the server.
+_SCHEMA_MISSING_SQL = 'SELECT to_regclass(%s) IS NULL;'
+_ADD_USER_SQL = 'INSERT INTO users (username, password, email) VALUES (%s, %s, %s) RETURNING user_id;'
+_GET_USER_SQL = 'EXECUTE get_user_stmt(%s);'
+_ADD_TRANSACTION_SQL = 'EXECUTE add_transaction_stmt(%s, %s, %s, %s, %s, %s);'
+_ADD_TRANSACTIONS_SQL = 'INSERT INTO transactions (user_id, amount, category, description, date, type) VALUES %s;'
+_ADD_TRANSACTIONS_TEMPLATE = '(%s, %s, %s, %s, %s, %s)'
+_CREATE_IMPORT_TABLE_SQL = ('CREATE TEMP TABLE transactions_import '
+                            '(amount DECIMAL, category INTEGER, description TEXT, date DATE, type INTEGER);')
+_COPY_IMPORT_SQL = 'COPY transactions_import FROM STDIN WITH (FORMAT csv, HEADER {header});'
+_MOVE_IMPORT_SQL = ('INSERT INTO transactions (user_id, amount, category, description, date, type) '
+                    'SELECT %s, amount, category, description, date, type FROM transactions_import;')
+_DROP_IMPORT_TABLE_SQL = 'DROP TABLE transactions_import;'
+_COPY_TRANSACTIONS_SQL = 'COPY transactions (user_id, amount, category, description, date, type) FROM STDIN WITH (FORMAT csv);'
+_TOTALS_SQL = 'EXECUTE totals_stmt(%s);'
+_DELETE_TRANSACTION_SQL = 'DELETE FROM transactions WHERE transaction_id=%s RETURNING transaction_id;'
+_DELETE_OWN_TRANSACTION_SQL = 'DELETE FROM transactions WHERE transaction_id=%s AND user_id=%s RETURNING transaction_id;'
+_CHECK_ELIGIBLE_SQL = 'EXECUTE check_eligible_stmt(%s, %s);'
+# Savepoint of a nested `Database.transaction` block. Reusing the name is fine: each statement refers to the newest one.
+_SAVEPOINT_SQL = 'SAVEPOINT nested_transaction;'
+_ROLLBACK_TO_SAVEPOINT_SQL = 'ROLLBACK TO SAVEPOINT nested_transaction;'
+_RELEASE_SAVEPOINT_SQL = 'RELEASE SAVEPOINT nested_transaction;'
+
+# Errors handled by the `Database` methods: failed statements, and a pool that has no connection left to hand out,
+# which `ThreadedConnectionPool.getconn` reports with a `PoolError` rather than a `DatabaseError`.
+_DATABASE_ERRORS = (psycopg2.DatabaseError, PoolError)
+
+# Bounds of the connection pool; a few connections per CPU core keep the server busy without oversubscribing it.
+_POOL_MINCONN = 1
+_POOL_MAXCONN = 2 * (os.cpu_count() or 1)
+
+# Columns of the `transactions` table that `Database.update_transaction` is allowed to set.
+_UPDATABLE_COLUMNS = frozenset({'amount', 'description', 'category', 'date', 'type'})
+
+# The last relation created by `_SCHEMA_SQL`; when it exists, the schema is already in place.
+_SCHEMA_PROBE = 'idx_tx_user_category'
+
+# Both lookup tables in one round trip, tagged with the table each row comes from, oldest ids first.
+_LOOKUPS_SQL = '''SELECT 'category', category_id, category_name FROM categories
+UNION ALL SELECT 'type', type_id, type_name FROM types ORDER BY 2;'''
+
+# Ids of the seeded categories and transaction types, keyed by name, and their names, keyed by id. The lookup
+# tables are only ever seeded, so they are read once per process by `Database.db_init` and never joined against
+# afterwards. Databases created by older versions may hold the seed rows several times; every id keeps its name,
+# and each name maps to its oldest id, which is the one the application has always used.
+_CATEGORY_IDS = {}
+_TYPE_IDS = {}
+_CATEGORY_NAMES = {}
+_TYPE_NAMES = {}
+
+
+def _store_lookups(rows):
+    """
+    Fills `_CATEGORY_IDS`, `_TYPE_IDS`, `_CATEGORY_NAMES` and `_TYPE_NAMES` from the rows of `_LOOKUPS_SQL`.
+    """
+    tables = {'category': (_CATEGORY_IDS, _CATEGORY_NAMES), 'type': (_TYPE_IDS, _TYPE_NAMES)}
+    for table, row_id, name in rows:
+        ids, names = tables[table]
+        ids.setdefault(name, row_id)
+        names[row_id] = name
+
+
+class ConflictError(Exception):
+    """
+    Raised when a new user collides with an existing username or email address.
+    """
+
+
+class _TTLCache:
+    """
+    A small thread-safe least-recently-used cache whose entries expire `ttl` seconds after they are stored.
+    """
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        """
+        Returns the value cached under `key`, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Stores `value` under `key`, evicting the least recently used entry when the cache is full.
+        """
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        """
+        Removes `key` from the cache if it is present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+
+def _logs_database_errors(message, default=None):
+    """
+    Decorates a `Database` method so that a `psycopg2.DatabaseError` (or a `PoolError` of an exhausted pool)
+    escaping it is logged together with its traceback and `default` is returned instead.
+
+    The methods borrow their connections through `Database._conn` or `Database.transaction`, which return
+    them to the pool however the block exits, so the method body is left with only its queries.
+
+    Args:
+        message (str): The message logged when a database error occurs.
+        default: The value returned when a database error occurs. It is shared between calls, so it should be immutable.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except _DATABASE_ERRORS:
+                logger.exception(message)
+                return default
+        return wrapper
+    return decorator
+
+
+def _copy_field(value):
+    """
+    Formats a value as a field of `COPY ... (FORMAT csv)`. None becomes an unquoted empty field, which `COPY`
+    reads as NULL, while strings are always quoted, so that an empty string is kept as an empty string.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+def _cast_numeric_as_float(value, cursor):
+    """
+    Parses a NUMERIC value as a float, skipping the costlier `Decimal` constructor.
+    """
+    return float(value) if value is not None else None
+
+
+# Typecaster registered on the cursors of `fetch_data` and `iter_data` when `numeric_as_float` is set.
+_NUMERIC_AS_FLOAT = new_type(DECIMAL.values, 'NUMERIC_AS_FLOAT', _cast_numeric_as_float)
+
+
+# Recently fetched users, keyed by username. The short TTL bounds how stale a cached row can get.
+_USER_CACHE = _TTLCache(maxsize=4096, ttl=60)
+
+
+class _Connection(psycopg2.extensions.connection):
+    """
+    A connection that remembers whether the statements from `_PREPARE_SQL` exist in its session.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = False
+
+
+def _execute_prepared(cursor, statement, params):
+    """
+    Runs an `EXECUTE` of one of the statements from `_PREPARE_SQL`, preparing them again if the session
+    has lost them (e.g. after a `DISCARD ALL` issued by an external connection pooler).
+
+    The statement is retried only when nothing would be lost by it, that is in autocommit mode or as the
+    first statement of a transaction. Otherwise the error is raised, and the statements are prepared again
+    the next time the connection is handed out.
+    """
+    connection = cursor.connection
+    retry = connection.autocommit or connection.get_transaction_status() == TRANSACTION_STATUS_IDLE
+    try:
+        cursor.execute(statement, params)
+    except errors.InvalidSqlStatementName:
+        connection.prepared = False
+        if not retry:
+            raise
+        if not connection.autocommit:
+            connection.rollback()
+        cursor.execute(_PREPARE_SQL)
+        connection.prepared = True
+        cursor.execute(statement, params)
 
 
 class Database:
@@ -10,7 +308,7 @@ class Database:
     This module defines the `Database` class, which provides an abstraction for interacting with a PostgreSQL database.
 
     The `Database` class includes methods to:
-    - Establish and close database connections.
+    - Borrow connections from a shared connection pool and close the pool at shutdown.
     - Initialize the database schema and seed it with initial data.
     - Add, retrieve, update, and delete user and transaction records.
     - Check user permissions for transaction operations.
@@ -19,94 +317,238 @@ class Database:
     - Ensure the `.env` file contains the required database connection parameters (`DB_NAME`, `DB_USER`, `DB_PASSWORD`, `DB_HOST`, `DB_PORT`) before using this class.
     - Use the `db_init` method to create necessary tables and seed initial data.
     """
+    # The connection pool shared by all instances, created on first use and closed by `shutdown`.
+    _pool = None
+    _pool_lock = Lock()
+
     def __init__(self):
         """
         Initializes a Database instance.
 
-        This constructor sets up the database connection parameters by reading environment variables
-        defined in a `.env` file. It also initializes the `connection` attribute to `None`, which will
-        later hold the active database connection.
+        This constructor picks up the database connection parameters from the environment variables
+        (or the `.env` file), which are read only once per process. All instances share a single
+        connection pool, held by the `_pool` class attribute.
 
         Attributes:
-            db_name (str): The name of the database, fetched from the 'DB_NAME' environment variable.
-            db_user (str): The username for database access, fetched from the 'DB_USER' environment variable.
-            db_password (str): The password for the database user, fetched from the 'DB_PASSWORD' environment variable.
-            db_host (str): The hostname of the database server, fetched from the 'DB_HOST' environment variable.
-            db_port (str): The port number of the database server, fetched from the 'DB_PORT' environment variable.
-            connection (psycopg2.extensions.connection or None): The database connection object, initially set to `None`.
+            _cfg (SimpleNamespace): The connection parameters (`dbname`, `user`, `password`, `host`, `port`),
+                fetched from the 'DB_NAME', 'DB_USER', 'DB_PASSWORD', 'DB_HOST' and 'DB_PORT' environment variables,
+                and the precomputed connection string `dsn`.
+            _local (threading.local): Per-thread state, holding the cursor of the open `transaction` block.
 
         Notes:
             - Ensure that a `.env` file exists with the necessary environment variables before using this class.
-            - The actual database connection is not established during initialization. Use the `connect` method
-              to establish a connection.
+            - The actual database connection is not established during initialization. The pool is created
+              on first use by the `_conn` method.
         """
 
-        self.db_name = os.getenv('DB_NAME')
-        self.db_user = os.getenv('DB_USER')
-        self.db_password = os.getenv('DB_PASSWORD')
-        self.db_host = os.getenv('DB_HOST')
-        self.db_port = os.getenv('DB_PORT')
-        self.connection = None
+        self._cfg = _load_config()
+        self._local = local()
 
-    def connect(self):
+    @contextmanager
+    def _conn(self, prepare=True, readonly=False):
         """
-        This method is for establishing the connection using the environment variables.
+        Borrows a connection from the pool and returns it once the block is finished.
+
+        The pool is created lazily on the first call of any instance, so that each following operation reuses an
+        already established connection instead of paying for a new TCP handshake and authentication.
+        TCP keepalives let idle pooled connections survive NAT timeouts and reveal dead peers early,
+        and the statement timeout from `_SESSION_OPTIONS` bounds how long a slot can be held by a single query.
+        Any transaction left open by the block is rolled back by the pool when the connection is returned,
+        while connections that failed with a connection-level error are discarded instead of reused.
+        The first time a connection is handed out, the hot statements from `_PREPARE_SQL` are prepared
+        on it, so that methods can run them with `EXECUTE`.
+
+        Args:
+            prepare (bool): Whether to prepare the hot statements on the connection. `db_init` disables it,
+                            because the statements cannot be prepared before the tables exist.
+            readonly (bool): Whether the block only reads data. Such connections are switched to autocommit
+                             mode, which spares the implicit `BEGIN` and the rollback when the connection
+                             is returned. Writes must keep the default and call `commit` themselves.
+
+        Yields:
+            psycopg2.extensions.connection: A connection borrowed from the pool.
+
+        Raises:
+            psycopg2.DatabaseError: If the pool cannot establish a connection.
+            psycopg2.pool.PoolError: If all connections of the pool are in use.
         """
+        pool = Database._pool
+        if pool is None:
+            pool = self._create_pool()
+        connection = pool.getconn()
+        broken = False
         try:
-            self.connection = psycopg2.connect(
-                    dbname=self.db_name,
-                    user=self.db_user,
-                    password=self.db_password,
-                    host=self.db_host,
-                    port=self.db_port)
-        except psycopg2.DatabaseError:
-            print(f'A database error occurred.')
+            if readonly:
+                connection.autocommit = True
+            if prepare and not connection.prepared:
+                with connection.cursor() as cursor:
+                    cursor.execute(_PREPARE_SQL)
+                connection.prepared = True
+            yield connection
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            if readonly and not broken and not connection.closed:
+                connection.autocommit = False
+            pool.putconn(connection, close=broken)
 
-    def close(self):
+    @contextmanager
+    def transaction(self):
         """
-        This method is for closing the connection.
+        Runs a block of writes as a single database transaction.
+
+        The block receives a cursor on a pooled connection. The transaction is committed when the block
+        finishes and rolled back if it raises. Blocks nest: the write methods of this class use this
+        context manager too, so calling several of them inside an outer `with db.transaction():` makes
+        them share one transaction and a single commit (and WAL flush) instead of committing each write.
+        A nested block runs inside a savepoint: if it raises, only its own statements are rolled back, so
+        a failed write that a method logs and reports (e.g. by returning None) does not abort the outer
+        transaction, and the earlier writes of the outer block are still committed.
+
+        Yields:
+            psycopg2.extensions.cursor: The cursor of the current transaction.
+
+        Raises:
+            psycopg2.DatabaseError: If a statement or the commit fails; the transaction is rolled back.
         """
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is not None:
+            cursor.execute(_SAVEPOINT_SQL)
+            try:
+                yield cursor
+            except BaseException:
+                if not cursor.connection.closed:
+                    cursor.execute(_ROLLBACK_TO_SAVEPOINT_SQL)
+                raise
+            cursor.execute(_RELEASE_SAVEPOINT_SQL)
+            return
+        with self._conn() as connection, connection.cursor() as cursor:
+            self._local.cursor = cursor
+            try:
+                yield cursor
+                connection.commit()
+            except BaseException:
+                if not connection.closed:
+                    connection.rollback()
+                raise
+            finally:
+                self._local.cursor = None
+
+    def _create_pool(self):
+        """
+        Creates the shared connection pool, unless another thread has just done so.
+
+        Returns:
+            ThreadedConnectionPool: The shared connection pool.
+        """
+        with Database._pool_lock:
+            if Database._pool is None:
+                Database._pool = ThreadedConnectionPool(
+                    minconn=_POOL_MINCONN,
+                    maxconn=_POOL_MAXCONN,
+                    dsn=self._cfg.dsn,
+                    connection_factory=_Connection)
+            return Database._pool
+
+    def shutdown(self):
+        """
+        Closes all connections held by the shared pool. Call it once when the application exits.
+        """
+        with Database._pool_lock:
+            if Database._pool is not None:
+                Database._pool.closeall()
+                Database._pool = None
 
+    @_logs_database_errors('A database error occurred.')
     def db_init(self):
         """
         Initialize the database by creating the users, transactions, categories, types tables if it does not exist
+
+        The schema and seed data are sent in a single round trip. When the schema is already in place,
+        the DDL is skipped entirely after a cheap catalog lookup. The ids of the categories and transaction
+        types are then cached for `category_id` and `type_id`.
         """
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('''CREATE TABLE IF NOT EXISTS users(
-                        user_id serial PRIMARY KEY, 
-                        username VARCHAR(50) UNIQUE NOT NULL, 
-                        password BYTEA NOT NULL,
-                        email VARCHAR(100) UNIQUE NOT NULL);''')
-                cursor.execute('''CREATE TABLE IF NOT EXISTS categories(
-                        category_id serial PRIMARY KEY,
-                        category_name VARCHAR(255));''')
-                cursor.execute('''CREATE TABLE IF NOT EXISTS types(
-                        type_id serial PRIMARY KEY,
-                        type_name VARCHAR(10));''')
-                cursor.execute('''CREATE TABLE IF NOT EXISTS transactions(
-                        transaction_id serial PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(user_id),
-                        amount DECIMAL,
-                        category INTEGER REFERENCES categories(category_id),
-                        description TEXT,
-                        date DATE NOT NULL,
-                        type INTEGER REFERENCES types(type_id));''')
-                cursor.execute('''INSERT INTO categories (category_name) VALUES 
-                ('Food'), ('Transportation'), ('Utilities'), ('Entertainment'), ('Health'), ('Account') 
-                ON CONFLICT DO NOTHING;''')
-                cursor.execute('''INSERT INTO types (type_name) VALUES 
-                ('Income'), ('Expense') ON CONFLICT DO NOTHING;''')
-            self.connection.commit()
-        except psycopg2.DatabaseError:
-            print(f'A database error occurred.')
-        finally:
-            self.close()
+        with self._conn(prepare=False) as connection, connection.cursor() as cursor:
+            cursor.execute(_SCHEMA_MISSING_SQL, (_SCHEMA_PROBE,))
+            if cursor.fetchone()[0]:
+                cursor.execute(_SCHEMA_SQL)
+                connection.commit()
+            self._load_lookups(cursor)
+            connection.commit()
+
+    @staticmethod
+    def _load_lookups(cursor):
+        """
+        Fills `_CATEGORY_IDS`, `_TYPE_IDS`, `_CATEGORY_NAMES` and `_TYPE_NAMES` from the `categories` and `types` tables.
+        """
+        cursor.execute(_LOOKUPS_SQL)
+        _store_lookups(cursor.fetchall())
+
+    def _ensure_lookups(self):
+        """
+        Loads the lookup tables into `_CATEGORY_IDS`, `_TYPE_IDS` and their inverses if `db_init` has not.
+        If they cannot be loaded, the error is logged and the lookups find nothing.
+        """
+        if not _CATEGORY_IDS or not _TYPE_IDS:
+            try:
+                with self._conn(prepare=False, readonly=True) as connection, connection.cursor() as cursor:
+                    self._load_lookups(cursor)
+            except _DATABASE_ERRORS:
+                logger.exception('Failed to load the categories and transaction types.')
+
+    def _lookup(self, ids, name):
+        """
+        Returns the id cached under `name` in `ids`.
+        """
+        self._ensure_lookups()
+        return ids.get(name)
+
+    def category_id(self, name):
+        """
+        Returns the id of a category without querying the `categories` table.
+
+        Args:
+            name (str): The name of the category, e.g. 'Food'.
+
+        Returns:
+            int or None: The `category_id` of the category, or None if there is no such category.
+        """
+        return self._lookup(_CATEGORY_IDS, name)
+
+    def type_id(self, name):
+        """
+        Returns the id of a transaction type without querying the `types` table.
+
+        Args:
+            name (str): The name of the transaction type, 'Income' or 'Expense'.
+
+        Returns:
+            int or None: The `type_id` of the transaction type, or None if there is no such type.
+        """
+        return self._lookup(_TYPE_IDS, name)
+
+    def category_names(self):
+        """
+        Returns the names of all categories keyed by their id, without querying the `categories` table.
+
+        Returns:
+            dict: The category names keyed by `category_id`.
+        """
+        self._ensure_lookups()
+        return dict(_CATEGORY_NAMES)
+
+    def type_names(self):
+        """
+        Returns the names of all transaction types keyed by their id, without querying the `types` table.
 
+        Returns:
+            dict: The transaction type names keyed by `type_id`.
+        """
+        self._ensure_lookups()
+        return dict(_TYPE_NAMES)
+
+    @_logs_database_errors('An error occurred while adding the user.')
     def add_user(self, username, hashed_password, email):
         """
         Inserts a new user into the 'users' table.
@@ -117,56 +559,67 @@ class Database:
         - email (str): The email address of the user.
 
         Returns:
-        - bool: True if the insertion was successful, False otherwise.
+        - int or None: The `user_id` of the new user, returned by the `INSERT` itself so no follow-up
+          query is needed, or None if a database error occurred.
+
+        Raises:
+        - ConflictError: If the username or the email address is already taken. Inside an outer `transaction`
+          block, only the rejected insert is rolled back, so the caller may catch it and carry on.
         """
-        self.connect()
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('INSERT INTO users(username, password, email) VALUES (%s, %s, %s);',
-                               (username, hashed_password, email))
-                self.connection.commit()
-                return True
-        except psycopg2.DatabaseError:
-            print(f'An error occurred while adding the user.')
-            return False
-        finally:
-            self.close()
-
+            with self.transaction() as cursor:
+                cursor.execute(_ADD_USER_SQL, (username, hashed_password, email))
+                user_id = cursor.fetchone()[0]
+            self.invalidate_user(username)
+            return user_id
+        except errors.UniqueViolation as error:
+            raise ConflictError(f'The user {username} or the email {email} already exists.') from error
+
+    @_logs_database_errors('A database error has occurred while retrieving the user.')
     def get_user(self, username):
         """
         Retrieves a user's data from the database based on their username.
 
         This method connects to the database, executes a query to find a user
         by the given username, and returns a dictionary containing the user's
-        username, hashed password, and email if found. If the user does not
+        ID, username, hashed password, and email if found. The dictionary is built
+        by psycopg2's `RealDictCursor` while the row is fetched. If the user does not
         exist, or if a database error occurs, it returns None.
 
+        Found users are cached in-process for up to 60 seconds, so repeated lookups
+        (e.g. login followed by session checks) do not hit the database.
+
         Args:
         - username (str): The username of the user to retrieve.
 
         Returns:
-        - dict or None: A dictionary with keys 'username', 'password', and 'email'
+        - dict or None: A dictionary with keys 'user_id', 'username', 'password', and 'email'
           containing the user's data if the user is found, or None if the user
           does not exist or if a database error occurs.
 
         Exceptions:
-        - Prints an error message if a psycopg2.DatabaseError is raised during the query.
+        - Logs an error message if a psycopg2.DatabaseError is raised during the query.
         """
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('SELECT user_id, username, password, email FROM users WHERE username = %s;', (username,))
-                user = cursor.fetchone()
-                if user:
-                    return {'user_id': user[0], 'username': user[1], 'password': user[2], 'email': user[3]}
-                else:
-                    return None
-        except psycopg2.DatabaseError:
-            print(f'A database error has occurred while retrieving the user {username}.')
-            return None
-        finally:
-            self.close()
+        user = _USER_CACHE.get(username)
+        if user is not None:
+            return user
+        with self._conn(readonly=True) as connection, connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            _execute_prepared(cursor, _GET_USER_SQL, (username,))
+            user = cursor.fetchone()
+        if user is not None:
+            _USER_CACHE.set(username, user)
+        return user
+
+    def invalidate_user(self, username):
+        """
+        Drops a user from the `get_user` cache. Call it after changing the user's row in the database.
 
+        Args:
+        - username (str): The username of the user to drop from the cache.
+        """
+        _USER_CACHE.pop(username)
+
+    @_logs_database_errors('Failed to add transaction to database.')
     def add_transaction(self, user_id, amount, category, description, date, type_of_transaction):
         """
         Add a transaction to the database.
@@ -176,150 +629,357 @@ class Database:
 
         Args:
             user_id (int): The ID of the user associated with the transaction.
-            amount (float): The amount of the transaction (must be a positive value).
+            amount (Decimal): The amount of the transaction (must be a positive value).
             category (int): The transaction category, represented as an integer.
             description (str): A brief description of the transaction.
             date (datetime): The transaction date .
             type_of_transaction (int): The type of transaction, where 1 represents Income and 2 represents Expense.
 
         Returns:
-            bool:
-                - `True` if the transaction is successfully added to the database.
-                - `False` if an error occurs during the database operation.
+            int or None:
+                - The `transaction_id` of the new transaction, returned by the `INSERT` itself.
+                - `None` if an error occurs during the database operation.
 
         Exceptions:
             psycopg2.DatabaseError: Raised if there is an error interacting with the database.
 
         Notes:
-            - The database connection is established before the operation and closed afterward.
-            - Changes are committed to the database upon successful insertion.
-            - Any database errors are caught, and a message is printed for debugging purposes.
+            - A pooled connection is borrowed for the operation and returned to the pool afterward.
+            - Changes are committed to the database upon successful insertion, or together with the
+              enclosing `transaction` block if there is one.
+            - Any database errors are caught and logged together with their traceback.
+            - Messages are logged only after the connection is returned to the pool, so terminal I/O
+              never extends the transaction.
         """
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('''INSERT INTO 
-                transactions (user_id, amount, category, description, date, type) 
-                VALUES (%s, %s, %s, %s, %s, %s);''', (user_id, amount, category, description, date, type_of_transaction))
-                self.connection.commit()
-                print('Transaction added successfully. ')
-                return True
-        except psycopg2.DatabaseError:
-            print(f'Failed to add transaction to database.')
-            return False
-        finally:
-            self.close()
+        with self.transaction() as cursor:
+            _execute_prepared(cursor, _ADD_TRANSACTION_SQL, (user_id, amount, category, description, date, type_of_transaction))
+            transaction_id = cursor.fetchone()[0]
+        logger.info('Transaction %s added successfully. ', transaction_id)
+        return transaction_id
+
+    @_logs_database_errors('Failed to add transactions to database.', default=False)
+    def add_transactions(self, rows):
+        """
+        Add many transactions to the database at once.
+
+        The rows are sent with `execute_values`, which expands them into multi-row INSERT statements
+        of up to `page_size` rows each, so the whole batch costs a handful of round trips and a single
+        commit instead of one round trip and one commit per row. The explicit row template makes a
+        malformed row fail fast instead of producing a statement with the wrong number of columns.
+        Since the rows are sent in pages, `cursor.rowcount` only reflects the last page and is not
+        used to count the inserted rows.
+
+        Args:
+            rows (iterable): Tuples of `(user_id, amount, category, description, date, type_of_transaction)`,
+                             in the same order as the arguments of `add_transaction`. Amounts should
+                             already be `Decimal`s, converted once by the caller.
+
+        Returns:
+            bool:
+                - `True` if all transactions are successfully added to the database.
+                - `False` if an error occurs; in that case none of the rows are inserted.
+        """
+        with self.transaction() as cursor:
+            execute_values(cursor, _ADD_TRANSACTIONS_SQL, rows, template=_ADD_TRANSACTIONS_TEMPLATE, page_size=1000)
+        return True
 
-    def fetch_data(self, query, params):
+    @_logs_database_errors('Failed to import transactions to database.')
+    def import_transactions_csv(self, user_id, fileobj, header=False):
+        """
+        Import a user's transactions from a CSV file using PostgreSQL's `COPY`.
+
+        The file is streamed to the server with `copy_expert`, which bypasses per-row parsing,
+        planning and round trips entirely, making it the preferred path for large imports such as
+        bank statements. The rows are copied into a temporary table first and then moved into
+        `transactions` with the given `user_id` in a single `INSERT ... SELECT`, and the temporary table is dropped.
+
+        Args:
+            user_id (int): The ID of the user the imported transactions belong to.
+            fileobj (file-like): A text file (or `io.StringIO`) with the columns `amount`, `category`,
+                                 `description`, `date` (YYYY-MM-DD) and `type`, in this order.
+            header (bool): Whether the first line of the file is a header to skip.
+
+        Returns:
+            int or None: The number of imported transactions, or `None` if an error occurs;
+                         in that case none of the rows are imported.
+        """
+        with self.transaction() as cursor:
+            # A large file may legitimately take longer than the session's statement timeout.
+            cursor.execute('SET LOCAL statement_timeout = 0;')
+            cursor.execute(_CREATE_IMPORT_TABLE_SQL)
+            cursor.copy_expert(_COPY_IMPORT_SQL.format(header='true' if header else 'false'), fileobj)
+            cursor.execute(_MOVE_IMPORT_SQL, (user_id,))
+            count = cursor.rowcount
+            # Dropped right away, so that another import can run in the same enclosing `transaction` block.
+            cursor.execute(_DROP_IMPORT_TABLE_SQL)
+            return count
+
+    @_logs_database_errors('Failed to copy transactions to database.')
+    def copy_transactions(self, rows):
+        """
+        Add many transactions to the database at once using PostgreSQL's `COPY`.
+
+        The rows are written to an in-memory CSV buffer (formatted by `_copy_field`) and streamed to the server
+        with `copy_expert`, which skips parsing and planning an `INSERT` altogether. It is the fastest way to load
+        transactions that are already in memory, e.g. imported reports or fixtures; for a file on disk,
+        use `import_transactions_csv` instead.
+
+        Args:
+            rows (iterable): Tuples of `(user_id, amount, category, description, date, type_of_transaction)`,
+                             in the same order as the arguments of `add_transaction`. A `None` description
+                             is stored as NULL, while an empty one is stored as an empty string, as by
+                             `add_transaction`.
+
+        Returns:
+            int or None: The number of copied transactions, or `None` if an error occurs;
+                         in that case none of the rows are copied.
+        """
+        buffer = StringIO()
+        count = 0
+        for row in rows:
+            buffer.write(','.join(map(_copy_field, row)))
+            buffer.write('\n')
+            count += 1
+        buffer.seek(0)
+        with self.transaction() as cursor:
+            cursor.execute('SET LOCAL statement_timeout = 0;')
+            cursor.copy_expert(_COPY_TRANSACTIONS_SQL, buffer)
+        return count
+
+    def fetch_data(self, query, params, numeric_as_float=False):
         """
         Executes a database query with the provided parameters and returns the fetched results.
 
-        This method establishes a connection to the database, executes the provided SQL query using the
+        This method borrows a connection from the pool, executes the provided SQL query using the
         specified parameters, and retrieves the resulting data. It ensures proper resource management
-        by closing the database connection after the query is executed, regardless of success or failure.
+        by returning the connection to the pool after the query is executed, regardless of success or failure.
 
         Args:
             query (str): The SQL query to be executed. It should include parameter placeholders (e.g., %s).
             params (tuple): A tuple of parameters to be passed into the query, matching the placeholders.
+            numeric_as_float (bool): Whether to return NUMERIC columns as floats instead of `Decimal`s.
+                                     Parsing them is cheaper, so it suits results that are only displayed.
 
         Returns:
-            list: A list of records fetched from the database. Returns an empty list if an error occurs during execution.
+            list: A list of records fetched from the database, as plain tuples in the column order of the query,
+                  which is the cheapest form to build and to load into a DataFrame. Use `fetch_data_dicts` when
+                  the columns should be addressed by name. Returns an empty list if an error occurs during execution.
 
         Raises:
             psycopg2.DatabaseError: If there is an error during the query execution.
         """
 
-        self.connect()
         try:
-            with self.connection.cursor() as cursor:
+            with self._conn(readonly=True) as connection, connection.cursor() as cursor:
+                if numeric_as_float:
+                    register_type(_NUMERIC_AS_FLOAT, cursor)
                 cursor.execute(query, params)
                 return cursor.fetchall()
-        except psycopg2.DatabaseError:
-            print(f'Database error occurred.')
+        except _DATABASE_ERRORS:
+            logger.exception('Database error occurred.')
             return []
-        finally:
-            self.close()
 
-    def delete_transaction(self, transaction_id):
+    def fetch_data_dicts(self, query, params):
+        """
+        Executes a database query and returns the fetched records as dictionaries keyed by column name.
+
+        The dictionaries are built by psycopg2's `RealDictCursor` while the rows are fetched. Building them
+        costs more than the tuples returned by `fetch_data`, so prefer that method for large results.
+
+        Args:
+            query (str): The SQL query to be executed. It should include parameter placeholders (e.g., %s).
+            params (tuple): A tuple of parameters to be passed into the query, matching the placeholders.
+
+        Returns:
+            list: A list of dictionaries, one per record. Returns an empty list if an error occurs during execution.
+        """
+
+        try:
+            with self._conn(readonly=True) as connection, connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        except _DATABASE_ERRORS:
+            logger.exception('Database error occurred.')
+            return []
+
+    def totals(self, user_id):
+        """
+        Calculates the total income and total expenses of a user in a single query.
+
+        Both sums are computed by one grouped aggregate, so a balance costs one round trip and one
+        scan of the user's rows (an index-only scan on `idx_tx_user_type`) instead of two.
+
+        Args:
+            user_id (int): The ID of the user whose totals are to be calculated.
+
+        Returns:
+            dict: A dictionary mapping the transaction type id to its total amount. The 'Income' and
+                  'Expense' types (see `type_id`) default to 0 when they have no transactions.
+        """
+        totals = {self.type_id('Income'): 0, self.type_id('Expense'): 0}
+        try:
+            with self._conn(readonly=True) as connection, connection.cursor() as cursor:
+                _execute_prepared(cursor, _TOTALS_SQL, (user_id,))
+                totals.update(cursor.fetchall())
+        except _DATABASE_ERRORS:
+            logger.exception('Database error occurred.')
+        return totals
+
+    def iter_data(self, query, params, itersize=500, numeric_as_float=False):
+        """
+        Executes a database query and yields the resulting records one by one.
+
+        Unlike `fetch_data`, the records are read through a named (server-side) cursor, which
+        transfers them from the server in chunks of `itersize` rows. Peak memory therefore stays
+        bounded by the chunk size instead of growing with the size of the whole result.
+
+        Args:
+            query (str): The SQL query to be executed. It should include parameter placeholders (e.g., %s).
+            params (tuple): A tuple of parameters to be passed into the query, matching the placeholders.
+            itersize (int): The number of records fetched from the server per network round trip.
+            numeric_as_float (bool): Whether to return NUMERIC columns as floats instead of `Decimal`s.
+
+        Yields:
+            tuple: The records returned by the query. Nothing is yielded if an error occurs during execution.
+
+        Notes:
+            - The pooled connection is held until the generator is exhausted or closed.
+        """
+        try:
+            with self._conn() as connection, connection.cursor(name='iter_data') as cursor:
+                cursor.itersize = itersize
+                if numeric_as_float:
+                    register_type(_NUMERIC_AS_FLOAT, cursor)
+                cursor.execute(query, params)
+                yield from cursor
+        except _DATABASE_ERRORS:
+            logger.exception('Database error occurred.')
+
+    @_logs_database_errors('Error during deleting the transaction.')
+    def delete_transaction(self, transaction_id, user_id=None):
         """
         Deletes a transaction from the database.
 
         This method removes a transaction record from the `transactions` table based
-        on the specified `transaction_id`. It establishes a connection to the database,
-        executes the deletion query, and commits the changes.
+        on the specified `transaction_id` and commits the changes. When `user_id` is given,
+        the ownership check is part of the `DELETE` itself, so authorization and deletion
+        happen atomically in a single round trip, without a separate `check_if_eligible` call.
 
         Args:
-        transaction_id (int): The ID of the transaction to be deleted.
+            transaction_id (int): The ID of the transaction to be deleted.
+            user_id (int, optional): The ID of the user who must own the transaction.
+
+        Returns:
+            bool or None:
+                - `True` if the transaction was deleted.
+                - `False` if no matching transaction exists (or it belongs to another user).
+                - `None` if a database error occurred.
         """
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('DELETE FROM transactions WHERE transaction_id=%s;', (transaction_id, ))
-                print('Transaction deleted successfully. ')
-                self.connection.commit()
-        except psycopg2.DatabaseError:
-            print(f'Error during deleting the transaction.')
-        finally:
-            self.close()
+        if user_id is None:
+            query, params = _DELETE_TRANSACTION_SQL, (transaction_id,)
+        else:
+            query, params = _DELETE_OWN_TRANSACTION_SQL, (transaction_id, user_id)
+        with self.transaction() as cursor:
+            cursor.execute(query, params)
+            deleted = cursor.fetchone() is not None
+        if deleted:
+            logger.info('Transaction deleted successfully. ')
+        return deleted
+
+    @_logs_database_errors('Error during updating the transaction.')
+    def update_transaction(self, transaction_id, user_id=None, **fields):
+        """
+        Update any subset of the fields of a specific transaction in a single statement.
+
+        This method builds one `UPDATE` from the provided keyword arguments, so changing several
+        fields costs a single round trip and a single commit. Only the columns listed in
+        `_UPDATABLE_COLUMNS` are accepted, which keeps the generated SQL safe from injection.
+        When `user_id` is given, the ownership check is part of the `UPDATE` itself.
 
-    def update_amount_of_transaction(self, amount, transaction_id):
+        Parameters:
+            transaction_id (int): The ID of the transaction to be updated.
+            user_id (int, optional): The ID of the user who must own the transaction.
+            **fields: The new values, keyed by column name (`amount`, `description`, `category`, `date`, `type`).
+
+        Returns:
+            bool or None:
+                - `True` if the transaction was updated.
+                - `False` if no matching transaction exists (or it belongs to another user).
+                - `None` if a database error occurred.
+
+        Raises:
+            ValueError: If no fields are given or a field is not an updatable column.
+        """
+        if not fields:
+            raise ValueError('No fields to update.')
+        unknown = fields.keys() - _UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f'Cannot update column(s): {", ".join(sorted(unknown))}.')
+        set_clause = ', '.join(f'{column}=%s' for column in fields)
+        query = f'UPDATE transactions SET {set_clause} WHERE transaction_id=%s'
+        params = (*fields.values(), transaction_id)
+        if user_id is not None:
+            query += ' AND user_id=%s'
+            params += (user_id,)
+        with self.transaction() as cursor:
+            cursor.execute(query + ' RETURNING transaction_id;', params)
+            return cursor.fetchone() is not None
+
+    def update_amount_of_transaction(self, amount, transaction_id, user_id=None):
         """
         Update the amount of a specific transaction in the database.
 
-        This method connects to the database and updates the `amount` field of a
-        transaction identified by its `transaction_id`. It commits the changes and
-        provides feedback on the success or failure of the operation.
+        This method is a shortcut for `update_transaction` that updates only the `amount` field of a
+        transaction identified by its `transaction_id`, and provides feedback on the success of the operation.
 
         Parameters:
-            amount (float): The new amount to update in the transaction.
+            amount (Decimal): The new amount to update in the transaction.
             transaction_id (int): The ID of the transaction to be updated.
+            user_id (int, optional): The ID of the user who must own the transaction.
+
+        Returns:
+            bool or None: The result of `update_transaction`.
         """
 
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('UPDATE transactions set amount=%s WHERE transaction_id=%s', (amount, transaction_id))
-                print(f'New amount: {amount}. ')
-                print(f'Amount updated successfully in transaction {transaction_id}. ')
-                self.connection.commit()
-        except psycopg2.DatabaseError:
-            print(f'Error during updating the transaction.')
-        finally:
-            self.close()
+        updated = self.update_transaction(transaction_id, user_id, amount=amount)
+        if updated:
+            logger.info('New amount: %s. ', amount)
+            logger.info('Amount updated successfully in transaction %s. ', transaction_id)
+        return updated
 
-    def update_description_of_transaction(self, description, transaction_id):
+    def update_description_of_transaction(self, description, transaction_id, user_id=None):
         """
         Update the description of a specific transaction in the database.
 
-        This method connects to the database and updates the `description` field
-        of a transaction identified by its `transaction_id`. It commits the changes
-        and provides feedback on the success or failure of the operation.
+        This method is a shortcut for `update_transaction` that updates only the `description` field
+        of a transaction identified by its `transaction_id`, and provides feedback on the success of the operation.
 
         Parameters:
             description (str): The new description to update in the transaction.
             transaction_id (int): The ID of the transaction to be updated.
+            user_id (int, optional): The ID of the user who must own the transaction.
+
+        Returns:
+            bool or None: The result of `update_transaction`.
         """
 
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('UPDATE transactions set description=%s WHERE transaction_id=%s',
-                               (description, transaction_id))
-                print(f'New description: {description}. ')
-                print(f'Description updated successfully in transaction {transaction_id}. ')
-                self.connection.commit()
-        except psycopg2.DatabaseError:
-            print(f'Error during updating the transaction.')
-        finally:
-            self.close()
+        updated = self.update_transaction(transaction_id, user_id, description=description)
+        if updated:
+            logger.info('New description: %s. ', description)
+            logger.info('Description updated successfully in transaction %s. ', transaction_id)
+        return updated
 
+    @_logs_database_errors('Error during checking the eligibility', default=False)
     def check_if_eligible(self, user_id, transaction_id):
         """
         Checks if a user is eligible to modify or delete a specific transaction.
 
         This method verifies whether a given `user_id` is associated with a transaction
-        identified by `transaction_id`. It connects to the database, retrieves the `user_id`
-        associated with the transaction, and checks if it matches the provided `user_id`.
+        identified by `transaction_id`. The ownership test runs entirely in the database as a
+        single `EXISTS` query, which stops at the first matching row.
+
+        Deprecated for guarding mutations: pass `user_id` to `delete_transaction` or `update_transaction`
+        instead, which check ownership within the statement itself and return False if the user is not eligible.
 
         Args:
             user_id (int): The ID of the user attempting to access the transaction.
@@ -331,19 +991,6 @@ class Database:
             - `False` if no matching transaction is found or if the `user_id` does not match.
 
         """
-        self.connect()
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute('SELECT user_id FROM transactions WHERE transaction_id = %s;', (transaction_id,))
-                result = cursor.fetchone()
-                if result is None:
-                    print(f'No transaction found with ID {transaction_id}. ')
-                    return False
-                if user_id == result[0]:
-                    return True
-                else:
-                    return False
-        except psycopg2.DatabaseError:
-            print(f'Error during checking the eligibility')
-        finally:
-            self.close()
+        with self._conn(readonly=True) as connection, connection.cursor() as cursor:
+            _execute_prepared(cursor, _CHECK_ELIGIBLE_SQL, (transaction_id, user_id))
+            return cursor.fetchone()[0]
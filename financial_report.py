@@ -1,60 +1,94 @@
+import numpy as np
 import pandas as pd
 from database import Database
+import logging
+
+logger = logging.getLogger(__name__)
+
+# The listings return the raw category and type ids, which are mapped to their names by `FinancialReport`
+# from the lookup tables cached by `Database`, instead of joining those tables for every row.
+_ALL_TRANSACTIONS_QUERY = (
+    'SELECT transaction_id, user_id, amount, category, description, date, type FROM transactions '
+    'WHERE user_id = %s ORDER BY date DESC;')
+_DATE_TO_DATE_QUERY = (
+    'SELECT transaction_id, user_id, amount, category, description, date, type FROM transactions '
+    'WHERE user_id = %s AND date BETWEEN %s AND %s;')
+
+# Column dtypes of the transaction listings, so that pandas does not infer them cell by cell. Amounts arrive
+# as floats (see `numeric_as_float`); category and type may be NULL and are replaced by their names anyway.
+_TRANSACTION_DTYPE = np.dtype([
+    ("Transaction ID", 'i8'), ("User ID", 'i8'), ("Amount (PLN)", 'f8'),
+    ("Category", 'O'), ("Description", 'O'), ("Date", 'datetime64[D]'), ("Type", 'O')
+])
 
 
 class FinancialReport:
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, verbose=True):
         """
         Initializes the FinancialReport class.
 
         Args:
             db (Database): An instance of the Database class used to interact with the database.
+            verbose (bool): Whether the generated reports are printed to the console. Disable it when the
+                            reports are only used programmatically; status messages are logged either way.
+
+        Notes:
+            - The income and expense totals are fetched once per user and reused by every report of this
+              instance, so create a new instance (as `User.show_transactions` does for each menu session)
+              to see transactions written afterwards.
         """
 
         self.db = db
+        self.verbose = verbose
+        self._totals = {}
+        self._category_names = db.category_names()
+        self._type_names = db.type_names()
 
-    def fetch_all_transactions_from_db(self, user_id):
+    def _transactions_dataframe(self, records):
         """
-        Fetches all transactions for a given user from the database.
+        Builds a DataFrame of transaction records, replacing the category and type ids with their names.
 
-        This method executes a SQL query to retrieve all transactions associated
-        with a specific user, including details such as transaction ID, user ID,
-        amount, category, description, date, and transaction type.
+        The records are packed into a numpy structured array of `_TRANSACTION_DTYPE` as they are read, which gives
+        the DataFrame contiguous typed columns without per-cell type inference. No list of all the records is built,
+        so with a streaming source such as `Database.iter_data` only the packed array and the current chunk of
+        records are held in memory.
 
         Args:
-            user_id (int or str): The ID of the user whose transactions are to be fetched.
+            records (iterable): Transaction records as returned by the listing queries.
 
         Returns:
-            list: A list of transaction records where each record is a tuple containing
-                  transaction details. Returns `None` if an error occurs.
+            pd.DataFrame: The transactions, with the columns of `_TRANSACTION_DTYPE`.
+        """
+
+        df = pd.DataFrame(np.fromiter(records, dtype=_TRANSACTION_DTYPE))
+        df['Category'] = df['Category'].map(self._category_names)
+        df['Type'] = df['Type'].map(self._type_names)
+        return df
+
+    def iter_all_transactions(self, user_id):
         """
+        Yields all transactions for a given user, streaming them from the database.
 
-        query = '''SELECT 
-                    transactions.transaction_id, 
-                    transactions.user_id, 
-                    transactions.amount, 
-                    categories.category_name, 
-                    transactions.description, 
-                    transactions.date, 
-                    types.type_name
-                    FROM transactions 
-                    LEFT JOIN categories 
-                    ON transactions.category = categories.category_id
-                    LEFT JOIN types
-                    ON transactions.type = types.type_id
-                    WHERE user_id=%s;'''
-        try:
-            params = [user_id]
-            return self.db.fetch_data(query, tuple(params))
-        except ConnectionError:
-            print("Database connection failed.")
-            return None
+        The records are returned newest first and read in chunks through `Database.iter_data`,
+        so the raw records never have to be held in memory all at once.
+        The generator holds a pooled connection until it is exhausted or closed, so it should be
+        consumed promptly (e.g. straight into a DataFrame) rather than kept around.
+
+        Args:
+            user_id (int or str): The ID of the user whose transactions are to be fetched.
+
+        Yields:
+            tuple: A transaction record containing transaction ID, user ID, amount, category ID,
+                   description, date, and transaction type ID.
+        """
+
+        yield from self.db.iter_data(_ALL_TRANSACTIONS_QUERY, (user_id,), numeric_as_float=True)
 
     def generate_all_transactions_report(self, user_id):
         """
         Generates a detailed report of all transactions for a given user.
 
-        This method fetches all transactions from the database for the specified user
+        This method streams all transactions from the database for the specified user
         and organizes them into a pandas DataFrame with labeled columns. The report
         includes details such as transaction ID, user ID, amount, category, description,
         date, and type. If no transactions are found, an empty DataFrame is returned.
@@ -67,177 +101,150 @@ class FinancialReport:
                           are found, an empty DataFrame is returned.
         """
 
-        transactions = self.fetch_all_transactions_from_db(user_id)
-        if transactions:
-            columns = [
-                "Transaction ID", "User ID", "Amount (PLN)",
-                "Category", "Description", "Date", "Type"
-            ]
-            df = pd.DataFrame(transactions, columns=columns)
-            print(f'This is user {user_id} transactions. ')
-            print(df)
+        df = self._transactions_dataframe(self.iter_all_transactions(user_id))
+        if not df.empty:
+            logger.info('This is user %s transactions. ', user_id)
+            if self.verbose:
+                print(df)
             return df
         else:
-            print('No transactions found. ')
+            logger.info('No transactions found. ')
             return pd.DataFrame()
 
-    def fetch_total_income_from_db(self, user_id):
+    def generate_total_income_report(self, user_id):
         """
-        Fetches all income transactions for a given user from the database.
+        Generates a report of the total income for a given user.
 
-        This method executes a SQL query to retrieve the amounts of all transactions
-        categorized as "Income" for a specific user.
+        This method retrieves the total income for the specified user, summed by the database together
+        with the expenses and shared with the other reports of this instance, and organizes the result into
+        a pandas DataFrame with columns for the user ID and total income. If no income transactions are found,
+        an empty DataFrame is returned.
 
         Args:
-            user_id (int or str): The ID of the user whose income transactions are to be fetched.
+            user_id (int or str): The ID of the user whose total income report is to be generated.
 
         Returns:
-            list: A list of tuples where each tuple contains the amount of an income transaction.
-                  Returns `None` if an error occurs during the database query.
+            pd.DataFrame: A DataFrame containing the user ID and the total income.
+                          If no income transactions are found, an empty DataFrame is returned.
         """
 
-        query = '''SELECT amount
-                FROM transactions
-                LEFT JOIN types ON transactions.type = types.type_id
-                WHERE transactions.user_id = %s AND types.type_name = 'Income';'''
-        try:
-            params = [user_id]
-            return self.db.fetch_data(query, tuple(params))
-        except ConnectionError:
-            print("Database connection failed.")
-            return None
+        total_income = self._total_income(user_id)
+        if not total_income:
+            logger.info('No transactions found. ')
+            return pd.DataFrame()
+        else:
+            income_df = pd.DataFrame({'User ID': [user_id], 'Total Income': [total_income]})
+            logger.info('Total income is %s', total_income)
+            return income_df
 
-    def generate_total_income_report(self, user_id):
+    def generate_total_expenses_report(self, user_id):
         """
-        Generates a report of the total income for a given user.
+        Generates a report of the total expenses for a given user.
 
-        This method retrieves all income transactions for the specified user, calculates
-        the total income, and organizes the result into a pandas DataFrame with columns
-        for the user ID and total income. If no income transactions are found, an empty
-        DataFrame is returned.
+        This method retrieves the total expenses for the specified user, summed by the database together
+        with the income and shared with the other reports of this instance, and organizes the result into
+        a pandas DataFrame with columns for the user ID and total expenses. If no expense transactions are found,
+        an empty DataFrame is returned.
 
         Args:
-            user_id (int or str): The ID of the user whose total income report is to be generated.
+            user_id (int or str): The ID of the user whose total expenses report is to be generated.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the user ID and the total income.
-                          If no income transactions are found, an empty DataFrame is returned.
+            pd.DataFrame: A DataFrame containing the user ID and the total expenses.
+                          If no expense transactions are found, an empty DataFrame is returned.
         """
 
-        result = self.fetch_total_income_from_db(user_id)
-        df = pd.DataFrame(result, columns=['Amount'])
-        if df.empty:
-            print('No transactions found. ')
+        total_expenses = self._total_expenses(user_id)
+        if not total_expenses:
+            logger.info('No transactions found. ')
             return pd.DataFrame()
         else:
-            total_income = df['Amount'].sum()
-            income_df = pd.DataFrame({'User ID': [user_id], 'Total Income': [total_income]})
-            print(f'Total income is {total_income}')
-            return income_df
+            expenses_df = pd.DataFrame({'User ID': [user_id], 'Total expenses': [total_expenses]})
+            logger.info('Total expenses is %s', total_expenses)
+            return expenses_df
 
-    def fetch_total_expenses_from_db(self, user_id):
+    def _fetch_income_expense(self, user_id):
         """
-        Fetches all expense transactions for a given user from the database.
+        Fetches the total income and total expenses for a given user in a single round trip.
 
-        This method executes a SQL query to retrieve the amounts of all transactions
-        categorized as "Expense" for a specific user.
+        Both sums are computed by the database in one grouped query (`Database.totals`), so no
+        individual amounts are transferred to Python. The result is kept for the lifetime of this
+        instance, so the income, expenses and balance reports of one session share a single query.
 
         Args:
-            user_id (int or str): The ID of the user whose expense transactions are to be fetched.
+            user_id (int or str): The ID of the user whose totals are to be fetched.
 
         Returns:
-            list: A list of tuples where each tuple contains the amount of an expense transaction.
-                  Returns `None` if an error occurs during the database query.
+            dict: The totals keyed by 'Income' and 'Expense'. Types without transactions default to 0.
         """
 
-        query = '''SELECT amount 
-                FROM transactions 
-                LEFT JOIN types ON transactions.type = types.type_id 
-                WHERE transactions.user_id = %s AND types.type_name = 'Expense';'''
+        totals = self._totals.get(user_id)
+        if totals is None:
+            by_type = self.db.totals(user_id)
+            totals = self._totals[user_id] = {
+                name: by_type.get(self.db.type_id(name), 0) for name in ('Income', 'Expense')}
+        return totals
 
-        try:
-            params = [user_id]
-            return self.db.fetch_data(query, tuple(params))
-        except ConnectionError:
-            print("Database connection failed.")
-            return None
+    def _total_income(self, user_id):
+        """
+        Returns the total income for a given user as a scalar, without building a DataFrame.
 
-    def generate_total_expenses_report(self, user_id):
+        Args:
+            user_id (int or str): The ID of the user whose total income is to be returned.
+
+        Returns:
+            Decimal: The total income of the user, or 0 if no income transactions are found.
         """
-        Generates a report of the total expenses for a given user.
 
-        This method retrieves all expense transactions for the specified user, calculates
-        the total expenses, and organizes the result into a pandas DataFrame with columns
-        for the user ID and total expenses. If no expense transactions are found, an empty
-        DataFrame is returned.
+        return self._fetch_income_expense(user_id)['Income']
+
+    def _total_expenses(self, user_id):
+        """
+        Returns the total expenses for a given user as a scalar, without building a DataFrame.
 
         Args:
-            user_id (int or str): The ID of the user whose total expenses report is to be generated.
+            user_id (int or str): The ID of the user whose total expenses are to be returned.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the user ID and the total expenses.
-                          If no expense transactions are found, an empty DataFrame is returned.
+            Decimal: The total expenses of the user, or 0 if no expense transactions are found.
         """
 
-        result = self.fetch_total_expenses_from_db(user_id)
-        df = pd.DataFrame(result, columns=['Amount'])
-        if df.empty:
-            print('No transactions found. ')
-            return pd.DataFrame()
-        else:
-            total_expenses = df['Amount'].sum()
-            expenses_df = pd.DataFrame({'User ID': [user_id], 'Total expenses': [total_expenses]})
-            print(f'Total expenses is {total_expenses}')
-            return expenses_df
+        return self._fetch_income_expense(user_id)['Expense']
 
     def calculate_total_income(self, user_id):
         """
         Calculates the total income for a given user.
 
-        This method calls the `generate_total_income_report` method to retrieve the total
-        income for the specified user. If the report is empty (i.e., no income transactions),
-        it returns 0. Otherwise, it returns the total income value.
-
         Args:
             user_id (int or str): The ID of the user whose total income is to be calculated.
 
         Returns:
-            float: The total income of the user. Returns 0 if no income transactions are found.
+            Decimal: The total income of the user. Returns 0 if no income transactions are found.
         """
 
-        income_df = self.generate_total_income_report(user_id)
-        if income_df.empty:
-            return 0
-        return income_df["Total Income"].iloc[0]
+        return self._total_income(user_id)
 
     def calculate_total_expenses(self, user_id):
         """
         Calculates the total expenses for a given user.
 
-        This method calls the `total_expenses` method to retrieve the total expenses for
-        the specified user. If the report is empty (i.e., no expense transactions), it returns 0.
-        Otherwise, it returns the total expenses value.
-
         Args:
             user_id (int or str): The ID of the user whose total expenses are to be calculated.
 
         Returns:
-            float: The total expenses of the user. Returns 0 if no expense transactions are found.
+            Decimal: The total expenses of the user. Returns 0 if no expense transactions are found.
         """
 
-        expenses_df = self.generate_total_expenses_report(user_id)
-        if expenses_df.empty:
-            return 0
-        return expenses_df["Total expenses"].iloc[0]
+        return self._total_expenses(user_id)
 
     def generate_balance_report(self, user_id):
         """
         Generates a balance report showing the total income, total expenses, and balance for a given user.
 
-        This method calculates the total income and total expenses for the specified user,
-        then computes the balance as the difference between the total income and total expenses.
+        This method fetches the total income and total expenses for the specified user in a single
+        query, then computes the balance as the difference between the total income and total expenses.
         The result is organized into a pandas DataFrame with columns for the user ID, total income,
-        total expenses, and balance. The report is also printed to the console.
+        total expenses, and balance. The report is also printed to the console when `verbose` is set.
 
         Args:
             user_id (int or str): The ID of the user whose balance report is to be generated.
@@ -246,8 +253,9 @@ class FinancialReport:
             pd.DataFrame: A DataFrame containing the user ID, total income, total expenses, and balance.
         """
 
-        total_income = self.calculate_total_income(user_id)
-        total_expenses = self.calculate_total_expenses(user_id)
+        totals = self._fetch_income_expense(user_id)
+        total_income = totals['Income']
+        total_expenses = totals['Expense']
 
         balance = total_income - total_expenses
         balance_df = pd.DataFrame({
@@ -256,58 +264,19 @@ class FinancialReport:
             'Total expenses': [total_expenses],
             'Balance': [balance]
         })
-        print(f'Balance is {balance}')
-        print(balance_df)
+        logger.info('Balance is %s', balance)
+        if self.verbose:
+            print(balance_df)
         return balance_df
 
-    def fetch_date_to_date_data(self, user_id, start_date, end_date):
-        """
-        Fetches transaction data for a specific user within a specified date range.
-
-        This method constructs a SQL query to fetch transaction details, including transaction ID, user ID,
-        amount, category, description, date, and type, for a user within a given date range (start date to
-        end date). The results are returned as a list of records fetched from the database.
-
-        Args:
-            user_id (int or str): The user ID to filter the transaction data.
-            start_date (str): The start date for the date range in 'YYYY-MM-DD' format.
-            end_date (str): The end date for the date range in 'YYYY-MM-DD' format.
-
-        Returns:
-            list: A list of transaction records fetched from the database. Each record contains transaction
-                  details (transaction_id, user_id, amount, category_name, description, date, type_name).
-                  Returns None if an error occurs while fetching the data.
-        """
-
-        query = '''SELECT 
-                    transactions.transaction_id, 
-                    transactions.user_id, 
-                    transactions.amount, 
-                    categories.category_name, 
-                    transactions.description, 
-                    transactions.date, 
-                    types.type_name
-                    FROM transactions 
-                    LEFT JOIN categories 
-                    ON transactions.category = categories.category_id
-                    LEFT JOIN types
-                    ON transactions.type = types.type_id
-                    WHERE user_id=%s AND transactions.date BETWEEN %s AND %s;'''
-
-        try:
-            params = [user_id, start_date, end_date]
-            return self.db.fetch_data(query, tuple(params))
-        except ConnectionError:
-            print("Database connection failed.")
-            return None
-
     def generate_date_to_date_report(self, user_id, start_date, end_date):
         """
         Generates a report of transactions for a specific user within a specified date range.
 
-        This method retrieves transaction data for a user from the database between the provided
-        start and end dates, and then formats it into a Pandas DataFrame. The report includes details
-        such as transaction ID, user ID, amount, category, description, date, and transaction type.
+        This method streams transaction data for a user from the database between the provided
+        start and end dates in chunks, through `Database.iter_data`, and packs each record straight into
+        the array backing a Pandas DataFrame. The report includes details such as transaction ID, user ID,
+        amount, category, description, date, and transaction type.
         If no transactions are found for the specified date range, an empty DataFrame is returned.
 
         Args:
@@ -320,16 +289,13 @@ class FinancialReport:
                           are found, an empty DataFrame is returned.
         """
 
-        transactions = self.fetch_date_to_date_data(user_id, start_date, end_date)
-        if transactions:
-            columns = [
-                "Transaction ID", "User ID", "Amount (PLN)",
-                "Category", "Description", "Date", "Type"
-            ]
-            df = pd.DataFrame(transactions, columns=columns)
-            print(f'This is users transactions from {start_date} to {end_date}')
-            print(df)
+        transactions = self.db.iter_data(_DATE_TO_DATE_QUERY, (user_id, start_date, end_date), numeric_as_float=True)
+        df = self._transactions_dataframe(transactions)
+        if not df.empty:
+            logger.info('This is users transactions from %s to %s', start_date, end_date)
+            if self.verbose:
+                print(df)
             return df
         else:
-            print('No transactions found. ')
+            logger.info('No transactions found. ')
             return pd.DataFrame()
@@ -1,54 +1,87 @@
 from database import Database
-from user import User
+from user import User, warm_up_login
 from getpass4 import getpass
+import logging
+import sys
+
+# The main menu options after login, mapped to the `User` methods handling them. All take `(user, user_id, db)`.
+ACTIONS = {
+    1: User.show_transactions,
+    2: User.create_transaction,
+    3: User.delete_transaction,
+    4: User.update_transaction
+}
+
+
+def _batch_stdin_user():
+    """
+    Reads the username, password and email from the next three lines of a non-interactive stdin
+    (e.g. a redirected file or a pipe), without prompting for each of them.
+
+    Raises:
+        EOFError: If stdin ends before all three lines are read.
+    """
+    lines = []
+    for _ in range(3):
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError('Expected username, password and email on separate lines.')
+        lines.append(line.rstrip('\n'))
+    return User(*lines)
 
 
 def get_user_details():
+    if not sys.stdin.isatty():
+        return _batch_stdin_user()
     username = input('Enter your username: ')
     password = getpass('Enter your password: ')
     email = input('Enter your email: ')
     return User(username, password, email)
 
 
+def run_menu(user, user_id, db):
+    while True:
+        print('[1] View Transactions\n'
+              '[2] Add Transaction\n'
+              '[3] Delete Transaction\n'
+              '[4] Update transaction\n'
+              '[0] Exit')
+        try:
+            choice = int(input("Choose an option: "))
+
+            if choice == 0:
+                print("Goodbye!")
+                break
+            action = ACTIONS.get(choice)
+            if action is None:
+                print("Invalid option. Please try again. ")
+            else:
+                action(user, user_id, db)
+        except ValueError:
+            print(f'Input should be an integer.')
+
+
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     db = Database()
-    db.db_init()
-    user_choice = int(input('Select: [0] Register [1] Login'))
-    if user_choice == 0:
-        user = get_user_details()
-        user.register(db)
-        print('Run the application again to be able to log in. ')
-    elif user_choice == 1:
-        user = get_user_details()
-        if user.login(db, user.email):
-            print("Login successful.")
-            user_id = db.get_user(user.username)['user_id']
-            while True:
-                print('[1] View Transactions\n'
-                      '[2] Add Transaction\n'
-                      '[3] Delete Transaction\n'
-                      '[4] Update transaction\n'
-                      '[0] Exit')
-                try:
-                    choice = int(input("Choose an option: "))
-
-                    if choice == 0:
-                        print("Goodbye!")
-                        break
-                    elif choice == 1:
-                        user.show_transactions(user_id, db)
-                    elif choice == 2:
-                        user.create_transaction(user_id, db)
-                    elif choice == 3:
-                        user.delete_transaction(user_id, db)
-                    elif choice == 4:
-                        user.update_transaction(user_id, db)
-                    else:
-                        print("Invalid option. Please try again. ")
-                except ValueError:
-                    print(f'Input should be an integer.')
-    else:
-        print('Choose right option')
+    try:
+        db.db_init()
+        warm_up_login()
+        user_choice = int(input('Select: [0] Register [1] Login'))
+        if user_choice == 0:
+            user = get_user_details()
+            if user.register(db):
+                print("Registration successful.")
+                run_menu(user, user.user_id, db)
+        elif user_choice == 1:
+            user = get_user_details()
+            if user.login(db, user.email):
+                print("Login successful.")
+                run_menu(user, user.user_id, db)
+        else:
+            print('Choose right option')
+    finally:
+        db.shutdown()
 
 
 if __name__ == '__main__':
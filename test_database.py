@@ -0,0 +1,66 @@
+import unittest
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import psycopg2
+
+from database import Database, ConflictError, _load_config
+
+
+class NestedTransactionTest(unittest.TestCase):
+    """
+    Runs against the database configured for the application (see `_load_config`) and is skipped when it
+    cannot be reached. Every test works on a user of its own, which is deleted afterwards.
+    """
+    @classmethod
+    def setUpClass(cls):
+        try:
+            psycopg2.connect(_load_config().dsn).close()
+        except psycopg2.OperationalError as error:
+            raise unittest.SkipTest(f'PostgreSQL is not available: {error}')
+        cls.db = Database()
+        cls.db.db_init()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.shutdown()
+
+    def setUp(self):
+        self.username = f'test-{uuid.uuid4().hex[:12]}'
+        self.user_id = self.db.add_user(self.username, b'hash', f'{self.username}@example.com')
+
+    def tearDown(self):
+        with self.db.transaction() as cursor:
+            cursor.execute('DELETE FROM transactions WHERE user_id = %s;', (self.user_id,))
+            cursor.execute('DELETE FROM users WHERE user_id = %s;', (self.user_id,))
+        self.db.invalidate_user(self.username)
+
+    def add_transaction(self, category, description):
+        return self.db.add_transaction(self.user_id, Decimal('10'), category, description, date.today(), 1)
+
+    def transaction_ids(self):
+        rows = self.db.fetch_data('SELECT transaction_id FROM transactions WHERE user_id = %s;', (self.user_id,))
+        return {row[0] for row in rows}
+
+    def test_failed_nested_write_keeps_earlier_writes(self):
+        with self.db.transaction():
+            first = self.add_transaction(1, 'kept')
+            # An unknown category violates the foreign key; the error is logged and None is returned.
+            with self.assertLogs('database', 'ERROR'):
+                failed = self.add_transaction(-1, 'rejected')
+            second = self.add_transaction(2, 'kept')
+        self.assertIsNone(failed)
+        self.assertEqual(self.transaction_ids(), {first, second})
+
+    def test_caught_conflict_keeps_earlier_writes(self):
+        with self.db.transaction():
+            first = self.add_transaction(1, 'kept')
+            with self.assertRaises(ConflictError):
+                self.db.add_user(self.username, b'hash', f'other-{self.username}@example.com')
+            second = self.add_transaction(2, 'kept')
+        self.assertEqual(self.transaction_ids(), {first, second})
+
+
+if __name__ == '__main__':
+    unittest.main()
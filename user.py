@@ -1,8 +1,216 @@
-import bcrypt
-from email_validator import validate_email, EmailNotValidError
-from database import Database
+from database import Database, ConflictError, _load_config
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from financial_report import FinancialReport
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+import asyncio
+import logging
+import pandas as pd
+import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+# The bcrypt work factor used for new password hashes, unless the `BCRYPT_COST` environment variable (or `.env`)
+# sets another one within `_BCRYPT_COST_RANGE`. Each step doubles the cost of hashing a password, so deployments
+# can tune it against their login latency.
+_DEFAULT_BCRYPT_COST = 12
+_BCRYPT_COST_RANGE = range(4, 32)
+
+# Prefixes and length of a well-formed bcrypt hash, checked before the expensive `bcrypt.checkpw`.
+# bcrypt itself is imported where passwords are hashed or checked, so importing this module does not load it.
+_BCRYPT_PREFIXES = (b'$2a$', b'$2b$', b'$2y$')
+_BCRYPT_HASH_LENGTH = 60
+
+# Threads hashing passwords for `User.register_async`. bcrypt releases the GIL while hashing,
+# so concurrent registrations use all CPU cores without blocking the event loop.
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# The transaction categories, in the order they are seeded by `Database.db_init`, and the menu listing them.
+# The mapping is read-only, so it can be shared by any consumer without being modified by accident.
+CATEGORIES = MappingProxyType({
+    1: 'Food',
+    2: 'Transportation',
+    3: 'Utilities',
+    4: 'Entertainment',
+    5: 'Health',
+    6: 'Account'
+})
+CATEGORY_MENU = 'Select a category: \n' + ''.join(f'{key}: {value}\n' for key, value in CATEGORIES.items())
+
+# Plain decimal numbers, optionally with an exponent. Input that does not match is rejected before `Decimal` parses it.
+_AMOUNT_RE = re.compile(r'^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*$')
+
+# Plain ASCII addresses that `validate_email` is certain to accept, so they can be normalized without it.
+# Special-use domains, which it rejects, are excluded by `_SPECIAL_USE_TLDS`.
+_FAST_EMAIL_RE = re.compile(
+    r'([A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*)@((?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63})')
+_SPECIAL_USE_TLDS = frozenset({'arpa', 'invalid', 'local', 'localhost', 'onion', 'test'})
+
+# The columns of a CSV file read by `User.create_transactions_bulk`, named in its header row.
+_CSV_COLUMNS = ('amount', 'category', 'description', 'date', 'type')
+
+# The transaction types accepted by `User.get_transaction_type`: 1 for Income, 2 for Expense, and the menu listing them.
+_VALID_TX_TYPES = frozenset((1, 2))
+TRANSACTION_TYPE_MENU = 'Select type of transaction [1] Income [2] Expense: \n'
+
+
+@lru_cache(maxsize=1)
+def _bcrypt_cost():
+    """
+    Returns the bcrypt work factor for new password hashes, read once on first use, after `.env` is loaded.
+
+    A `BCRYPT_COST` that is not an integer within `_BCRYPT_COST_RANGE` is logged and `_DEFAULT_BCRYPT_COST`
+    is used instead.
+    """
+    _load_config()
+    value = os.getenv('BCRYPT_COST')
+    if value is None:
+        return _DEFAULT_BCRYPT_COST
+    try:
+        cost = int(value)
+    except ValueError:
+        cost = None
+    if cost not in _BCRYPT_COST_RANGE:
+        logger.warning('Invalid BCRYPT_COST %r, using %s instead.', value, _DEFAULT_BCRYPT_COST)
+        return _DEFAULT_BCRYPT_COST
+    return cost
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash():
+    """
+    Returns a bcrypt hash with the same work factor as real ones, computed once on first use. `User.login` checks
+    the password against it when the username does not exist, so that both cases take the same time.
+    Call `warm_up_login` before the first login, so that it does not pay for computing this hash.
+    """
+    import bcrypt
+    return bcrypt.hashpw(b'dummy password', bcrypt.gensalt(rounds=_bcrypt_cost(), prefix=b'2b'))
+
+
+def warm_up_login():
+    """
+    Computes the dummy hash used by `User.login` for unknown usernames ahead of time. Otherwise the first
+    login of an unknown user runs bcrypt twice and takes measurably longer than the login of a known one.
+    """
+    _dummy_hash()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(address):
+    """
+    Returns the normalized form of an email address, or None if it is not valid.
+
+    Only the syntax is checked, without looking up the domain's mail servers. Common ASCII addresses
+    matching `_FAST_EMAIL_RE` are normalized directly, the way `validate_email` does it (the domain is
+    lowercased, the local part is kept as is); anything else goes through `validate_email`. Results are
+    cached, so an address is parsed only once per process. `email_validator` is imported only when
+    an address needs it, since the fast path covers most addresses.
+    """
+    match = _FAST_EMAIL_RE.fullmatch(address)
+    if match and len(match.group(1)) <= 64 and len(address) <= 254:
+        local_part, domain = match.groups()
+        domain = domain.lower()
+        if domain.rpartition('.')[2] not in _SPECIAL_USE_TLDS:
+            return f'{local_part}@{domain}'
+    from email_validator import validate_email, EmailNotValidError
+    try:
+        return validate_email(address, check_deliverability=False).normalized
+    except EmailNotValidError:
+        return None
+
+
+def _parse_date(text):
+    """
+    Parses a date in the 'YYYY-MM-DD' format.
+
+    Well-formed input is parsed by slicing out the three numbers, which is much faster than `datetime.strptime`;
+    anything else (e.g. single-digit months) goes through `strptime`, which accepts the same formats as before.
+
+    Args:
+        text (str): The date string to be parsed.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the string is not a valid date in the 'YYYY-MM-DD' format.
+    """
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        digits = text[:4] + text[5:7] + text[8:]
+        if digits.isascii() and digits.isdigit():
+            return datetime(int(text[:4]), int(text[5:7]), int(text[8:]))
+    return datetime.strptime(text, '%Y-%m-%d')
+
+
+def _parse_amount(text):
+    """
+    Parses a positive transaction amount into a `Decimal`.
+
+    Raises:
+        ValueError: If the text is not a number or the amount is not positive; the message says which.
+    """
+    if not _AMOUNT_RE.match(text):
+        raise ValueError('You should type a valid number. ')
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError('You should type a valid number. ') from None
+    if not (amount.is_finite() and amount > 0):
+        raise ValueError('Amount must be positive.')
+    return amount
+
+
+def _parse_category(text):
+    """
+    Parses the number of one of the `CATEGORIES`.
+
+    Raises:
+        ValueError: If the text is not a number or not one of the categories; the message says which.
+    """
+    try:
+        category = int(text)
+    except ValueError:
+        raise ValueError('You should type a number corresponding to a category. ') from None
+    if category not in CATEGORIES:
+        raise ValueError('Invalid choice. Please select a valid category.  ')
+    return category
+
+
+def _parse_transaction_type(text):
+    """
+    Parses a transaction type, 1 for Income or 2 for Expense.
+
+    Raises:
+        ValueError: If the text is not a number or not one of the types; the message says which.
+    """
+    try:
+        type_of_transaction = int(text)
+    except ValueError:
+        raise ValueError('You should type a number (1 or 2). ') from None
+    if type_of_transaction not in _VALID_TX_TYPES:
+        raise ValueError('Invalid choice. Please select 1 or 2.')
+    return type_of_transaction
+
+
+def _parse_or_none(parse, text):
+    """
+    Returns `parse(text)` for one of the `_parse_*` helpers, or None if the text is not valid.
+    """
+    try:
+        return parse(text)
+    except ValueError:
+        return None
+
+
+def _parse_optional_date(text):
+    """
+    Parses a date like `_parse_date`, using today's date if the text is empty, as `User.get_valid_date` does.
+    """
+    return _parse_date(text) if text else datetime.now()
 
 
 class User:
@@ -12,14 +220,22 @@ class User:
     Attributes:
     - username (str): The username of the user.
     - password (str): The plain-text password of the user, which will be hashed upon registration.
+      Only its UTF-8 encoding is kept, and only until the user is registered or a login attempt is made;
+      reading the attribute returns None.
     - email (str): The user's email address.
+    - bcrypt_cost (int or None): The bcrypt work factor used when the password is hashed upon registration,
+      or None to use the configured one.
+    - user_id (int or None): The ID of the user, set by a successful `register` or `login`.
 
     Methods:
     - __str__(): Returns a string representation of the user.
     - check_email(): Validates the email format.
     - register(db): Registers the user by hashing the password and saving the data to the database.
     """
-    def __init__(self, username: str, password: str, email: str):
+    # Fixed attribute slots instead of a per-instance `__dict__`. `password` is a property storing `_password_bytes`.
+    __slots__ = ('username', '_password_bytes', 'email', 'bcrypt_cost', 'user_id', '_row')
+
+    def __init__(self, username: str, password: str, email: str, bcrypt_cost: int = None):
         """
         Initializes a User instance with a username, password, and email address.
 
@@ -27,10 +243,27 @@ class User:
         - username (str): The username of the user.
         - password (str): The plain-text password of the user.
         - email (str): The email address of the user.
+        - bcrypt_cost (int): The bcrypt work factor for hashing the password. By default, it is read from
+          the `BCRYPT_COST` environment variable when the password is hashed.
+          It only affects registration; `login` reads the cost of the stored hash from its prefix.
         """
         self.username = username
         self.password = password
         self.email = email
+        self.bcrypt_cost = bcrypt_cost
+        self.user_id = None
+        self._row = None
+
+    @property
+    def password(self):
+        """
+        The plain-text password is not kept after it is set, only its UTF-8 encoding, so this is always None.
+        """
+        return None
+
+    @password.setter
+    def password(self, password):
+        self._password_bytes = password.encode('utf-8')
 
     def __str__(self):
         """
@@ -45,38 +278,88 @@ class User:
         """
         Validates the user's email address.
 
+        Only the syntax is checked; the domain's mail servers are not looked up, which would cost a
+        blocking DNS round trip. Results are cached by `_normalize_email` for the whole process.
+
         Returns:
         - str: The normalized email address if valid.
         - None: If the email address is not valid.
-
-        Raises:
-        - EmailNotValidError: If the email is not in a valid format.
         """
-        try:
-            validated_email = validate_email(self.email).normalized
-            return validated_email
-        except EmailNotValidError:
+        validated_email = _normalize_email(self.email)
+        if validated_email is None:
             print(f'Invalid email.')
-            return None
+        return validated_email
 
     def register(self, db):
         """
         Registers the user by hashing the password and saving the user's data to the database.
 
+        On success, `user_id` is set to the ID of the new user, so the user can start a session
+        right away without logging in, which would hash the password a second time. The encoded
+        password is then dropped, since it is not needed anymore.
+
         Args:
         - db: A database connection object with an add_user method for saving user data.
 
         Returns:
-        - bool: True if registration is successful; False if email validation fails.
+        - bool: True if registration is successful; False if email validation fails,
+          the username or email is already taken, or a database error occurs.
         """
-        hashed_password = bcrypt.hashpw(self.password.encode('utf-8'), bcrypt.gensalt())
         valid_email = self.check_email()
         if valid_email is None:
             return False
+        saved = self._save(db, self._hash_password(), valid_email)
+        if saved:
+            self._password_bytes = None
+        return saved
+
+    async def register_async(self, db):
+        """
+        Registers the user like `register`, without blocking the running event loop.
+
+        The password is hashed on the `_HASH_POOL` threads and the user is saved on the loop's default
+        executor, so other coroutines keep running while a registration is in progress.
 
-        if db.add_user(self.username, hashed_password, valid_email):
-            return True
-        else:
+        Args:
+        - db (Database): The database instance used to save the user's data.
+
+        Returns:
+        - bool: The same result as `register`.
+        """
+        valid_email = self.check_email()
+        if valid_email is None:
+            return False
+        loop = asyncio.get_running_loop()
+        hashed_password = await loop.run_in_executor(_HASH_POOL, self._hash_password)
+        saved = await loop.run_in_executor(None, self._save, db, hashed_password, valid_email)
+        if saved:
+            self._password_bytes = None
+        return saved
+
+    def _hash_password(self):
+        """
+        Hashes the user's password with bcrypt using the `bcrypt_cost` work factor, or the configured one if it is None.
+
+        Returns:
+        - bytes: The bcrypt hash of the password.
+        """
+        import bcrypt
+        rounds = self.bcrypt_cost if self.bcrypt_cost is not None else _bcrypt_cost()
+        return bcrypt.hashpw(self._password_bytes, bcrypt.gensalt(rounds=rounds, prefix=b'2b'))
+
+    def _save(self, db, hashed_password, valid_email):
+        """
+        Saves the user's data to the database and sets `user_id` to the ID of the new user.
+
+        Returns:
+        - bool: True if the user was saved; False if the username or email is already taken,
+          or a database error occurs.
+        """
+        try:
+            self.user_id = db.add_user(self.username, hashed_password, valid_email)
+            return self.user_id is not None
+        except ConflictError:
+            print('Username or email already taken. ')
             return False
 
     def login(self, db, email):
@@ -85,7 +368,12 @@ class User:
 
         This method verifies the user's credentials by checking the provided username,
         password, and email against stored data in the database. It uses bcrypt for
-        secure password comparison.
+        secure password comparison. For an unknown username, the password is still checked
+        against a dummy hash, so the response time does not reveal whether the user exists.
+
+        On success, the user's row is kept on the instance and `user_id` is set, so the caller
+        does not have to query the database for it again. Whatever the outcome, the encoded password
+        is dropped afterwards; set `password` again before another attempt.
 
         Args:
             db (Database): The database instance to fetch user data.
@@ -93,22 +381,98 @@ class User:
         """
         try:
             user_data = db.get_user(self.username)
-            if not user_data:
-                print("Username not found. ")
-                return False
-            hashed_password_from_db = bytes(user_data['password'])
-            if bcrypt.checkpw(self.password.encode('utf-8'), hashed_password_from_db):
-                if email == user_data['email']:
-                    return True
-                else:
-                    print('Invalid email. ')
-                    return False
-            else:
-                print("Invalid password. ")
-                return False
-        except ConnectionError:
-            print(f"Error accessing the database.")
+            return self._accept(user_data, email, self._check_password(user_data))
+        except (KeyError, TypeError, ValueError):
+            print("Invalid user data in the database. ")
+            return False
+        finally:
+            self._password_bytes = None
+
+    async def login_async(self, db, email):
+        """
+        Authenticates the user like `login`, without blocking the running event loop.
+
+        The user is fetched on the loop's default executor and the password is checked on the `_HASH_POOL`
+        threads, so concurrent logins are verified in parallel on all CPU cores.
+
+        Args:
+            db (Database): The database instance to fetch user data.
+            email (str): The email provided by the user for authentication.
+
+        Returns:
+            bool: The same result as `login`.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            user_data = await loop.run_in_executor(None, db.get_user, self.username)
+            password_ok = await loop.run_in_executor(_HASH_POOL, self._check_password, user_data)
+            return self._accept(user_data, email, password_ok)
+        except (KeyError, TypeError, ValueError):
+            print("Invalid user data in the database. ")
+            return False
+        finally:
+            self._password_bytes = None
+
+    def _check_password(self, user_data):
+        """
+        Checks the user's password against the stored bcrypt hash, or against a dummy hash if the user
+        does not exist, so that both cases take the same time. A stored value that is not a well-formed
+        bcrypt hash is rejected right away, without running bcrypt's key schedule.
+
+        Args:
+            user_data (dict or None): The user's row, as returned by `Database.get_user`.
+
+        Returns:
+            bool: True if the user exists and the password matches.
+        """
+        import bcrypt
+        if not user_data:
+            bcrypt.checkpw(self._password_bytes, _dummy_hash())
+            return False
+        hashed_password_from_db = user_data['password']
+        if not isinstance(hashed_password_from_db, bytes):
+            # psycopg2 returns `bytea` columns as memoryviews; rows built elsewhere may already hold bytes.
+            hashed_password_from_db = bytes(hashed_password_from_db)
+        if len(hashed_password_from_db) != _BCRYPT_HASH_LENGTH or not hashed_password_from_db.startswith(_BCRYPT_PREFIXES):
+            return False
+        return bcrypt.checkpw(self._password_bytes, hashed_password_from_db)
+
+    def _accept(self, user_data, email, password_ok):
+        """
+        Decides the outcome of a login attempt once the password has been checked.
+
+        On success, the user's row is kept on the instance and `user_id` is set.
+
+        Returns:
+            bool: True if the user exists, the password matches and the email is the user's.
+        """
+        if not user_data:
+            print("Username not found. ")
+            return False
+        if not password_ok:
+            print("Invalid password. ")
             return False
+        if email != user_data['email']:
+            print('Invalid email. ')
+            return False
+        self._row = user_data
+        self.user_id = user_data['user_id']
+        return True
+
+    def refresh(self, db):
+        """
+        Reloads the user's row from the database, e.g. after it has been changed elsewhere.
+
+        Args:
+            db (Database): The database instance to fetch user data.
+
+        Returns:
+            bool: True if the user still exists, False otherwise.
+        """
+        db.invalidate_user(self.username)
+        self._row = db.get_user(self.username)
+        self.user_id = self._row['user_id'] if self._row else None
+        return self._row is not None
 
     def create_transaction(self, user_id, db):
         """
@@ -123,7 +487,7 @@ class User:
             user_id (int): The ID of the user creating the transaction.
 
         Inputs:
-            - Amount (float): Positive numeric value for the transaction amount.
+            - Amount (Decimal): Positive numeric value for the transaction amount.
             - Category (int): One of the predefined categories.
             - Description (str): A description of the transaction.
             - Date (datetime): Transaction date in the format YYYY-MM-DD.
@@ -131,13 +495,95 @@ class User:
 
         Adds:
             The validated transaction to the database using the `db.add_transaction` method.
+
+        Returns:
+            int or None: The ID of the new transaction, or None if it could not be added.
         """
         amount = self.get_amount()
         category = self.get_category()
         description = self.get_description()
         valid_date = self.get_valid_date()
         type_of_transaction = self.get_transaction_type()
-        db.add_transaction(user_id, amount, category, description, valid_date, type_of_transaction)
+        return db.add_transaction(user_id, amount, category, description, valid_date, type_of_transaction)
+
+    def create_transaction_bulk(self, user_id, db, line):
+        """
+        Create a new transaction from a single line of input, without prompting for each detail.
+
+        The line holds the same details `create_transaction` asks for, separated by '|':
+        `amount|category|description|YYYY-MM-DD|type`. The description may itself contain '|',
+        and the date may be left empty to use today's date. This suits scripted input, where
+        the details are already known and read in one go.
+
+        Args:
+            user_id (int): The ID of the user creating the transaction.
+            db (Database): The database object used to store the transaction.
+            line (str): The transaction details, e.g. '12.50|1|Lunch|2024-05-01|2'.
+
+        Returns:
+            int or None: The ID of the new transaction, or None if the line is invalid
+            or the transaction could not be added.
+        """
+        fields = line.rstrip('\n').split('|', 2)
+        if len(fields) == 3:
+            fields[2:] = fields[2].rsplit('|', 2)
+        if len(fields) != 5:
+            print('Expected amount|category|description|YYYY-MM-DD|type. ')
+            return None
+        amount, category, description, transaction_date, type_of_transaction = fields
+        try:
+            amount = _parse_amount(amount)
+            category = _parse_category(category)
+            type_of_transaction = _parse_transaction_type(type_of_transaction)
+        except ValueError as e:
+            print(e)
+            return None
+        try:
+            valid_date = _parse_optional_date(transaction_date)
+        except ValueError:
+            print('Invalid date format. Please use YYYY-MM-DD. ')
+            return None
+        return db.add_transaction(user_id, amount, category, description, valid_date, type_of_transaction)
+
+    def create_transactions_bulk(self, user_id, db, path):
+        """
+        Create many transactions at once from a CSV file.
+
+        The file is read with pandas and must have a header row naming the columns `amount`, `category`,
+        `description`, `date` and `type`. Their values are validated by the same `_parse_*` helpers as the
+        prompts of `create_transaction`, so they accept the same input, and an empty date means today's date.
+        If any row is invalid, nothing is added. Otherwise all rows are sent to the database together with
+        `db.add_transactions`.
+
+        Args:
+            user_id (int): The ID of the user creating the transactions.
+            db (Database): The database object used to store the transactions.
+            path (str): The path of the CSV file.
+
+        Returns:
+            int or None: The number of added transactions, or None if the file cannot be read,
+            contains an invalid row, or the transactions could not be added.
+        """
+        try:
+            df = pd.read_csv(path, dtype=str, keep_default_na=False, usecols=_CSV_COLUMNS)
+        except (OSError, ValueError) as e:
+            print(f'Could not read {path}: {e}')
+            return None
+        if df.empty:
+            print('No transactions to import. ')
+            return 0
+        # The columns are parsed as plain lists, so that pandas does not convert the parsed values.
+        amounts = [_parse_or_none(_parse_amount, text) for text in df['amount'].tolist()]
+        categories = [_parse_or_none(_parse_category, text) for text in df['category'].tolist()]
+        dates = [_parse_or_none(_parse_optional_date, text) for text in df['date'].tolist()]
+        types = [_parse_or_none(_parse_transaction_type, text) for text in df['type'].tolist()]
+        # Line numbers in the file, counting the header row.
+        invalid = [str(index + 2) for index, row in enumerate(zip(amounts, categories, dates, types)) if None in row]
+        if invalid:
+            print(f'Invalid transactions on lines {", ".join(invalid[:10])}. Nothing was imported. ')
+            return None
+        rows = list(zip([user_id] * len(df), amounts, categories, df['description'].tolist(), dates, types))
+        return len(rows) if db.add_transactions(rows) else None
 
     def show_transactions(self, user_id, db):
         """
@@ -174,6 +620,16 @@ class User:
 
         try:
             report = FinancialReport(db)
+            reports = {
+                1: report.generate_all_transactions_report,
+                4: report.generate_balance_report
+            }
+            # The totals are printed here rather than logged by the report, so that they are shown
+            # whatever logging configuration the application uses.
+            totals = {
+                2: ('Total income', report.calculate_total_income),
+                3: ('Total expenses', report.calculate_total_expenses)
+            }
             while True:
                 user = int(input('Choose your option: '
                                  '[1] All transactions '
@@ -185,14 +641,12 @@ class User:
                 if user == 0:
                     print('Exiting. ')
                     break
-                elif user == 1:
-                    report.generate_all_transactions_report(user_id)
-                elif user == 2:
-                    report.generate_total_income_report(user_id)
-                elif user == 3:
-                    report.generate_total_expenses_report(user_id)
-                elif user == 4:
-                    report.generate_balance_report(user_id)
+                elif user in reports:
+                    reports[user](user_id)
+                elif user in totals:
+                    label, calculate = totals[user]
+                    total = calculate(user_id)
+                    print(f'{label} is {total}' if total else 'No transactions found. ')
                 elif user == 5:
                     while True:
                         start_date = self.is_valid_date(input('Enter start date (YYYY-MM-DD): '))
@@ -212,24 +666,21 @@ class User:
         """
         Deletes a specific transaction based on user input.
 
-        This method prompts the user to input a `transaction_id` and checks if the user
-        is eligible to delete the transaction using the `db.check_eligible` method.
-        If the user is eligible, the transaction is deleted using `db.delete_transaction`.
+        This method prompts the user to input a `transaction_id` and deletes the transaction
+        using `db.delete_transaction`, which only deletes it if it belongs to the user.
         If the user is not eligible, a message is displayed. If the input is invalid,
         an error message is shown prompting for a valid transaction ID.
 
         Args:
             user_id (int): The ID of the user attempting to delete the transaction.
-            db (Database): The database object used to check eligibility and delete the transaction.
+            db (Database): The database object used to delete the transaction.
 
         Raises:
             ValueError: If the input `transaction_id` cannot be converted to an integer.
         """
         try:
             transaction_id = int(input('Type the transaction_id to delete the transaction: '))
-            if db.check_if_eligible(user_id, transaction_id):
-                db.delete_transaction(transaction_id)
-            else:
+            if db.delete_transaction(transaction_id, user_id) is False:
                 print('You are not eligible to delete this transaction. ')
         except ValueError:
             print('Invalid input. Please enter a valid transaction ID.')
@@ -238,48 +689,58 @@ class User:
         """
         Update a transaction's details for a given user.
 
-        This method allows a user to update either the amount or the description of
+        This method allows a user to update the amount, the description, or both of
         a specific transaction if the transaction is eligible. The user is prompted
-        to choose the transaction to update and the field (amount or description) to modify.
+        to choose the transaction to update and the field(s) to modify. Changing both
+        fields is sent as a single `UPDATE`. The ownership check is part of that `UPDATE`,
+        so no separate eligibility query is made.
 
         Parameters:
             user_id (int): The ID of the user requesting the update.
             db (object): A database handler object that provides methods to interact
-                         with the database, such as checking eligibility and updating transactions.
+                         with the database, such as updating transactions.
 
         Prompts:
             - Transaction ID to specify which transaction to update.
-            - Choice between updating the amount or description.
+            - Choice between updating the amount, the description, or both.
 
         Behavior:
             - If the user chooses to update the amount, they will be prompted to input the new amount.
             - If the user chooses to update the description, they will be prompted to input the new description.
+            - If the user chooses to update both, they will be prompted for both and the changes are saved together.
             - Updates are committed to the database if the transaction is eligible and valid inputs are provided.
+            - If the transaction does not exist or belongs to another user, a message is displayed.
 
         Exceptions:
             - Prompts the user again if invalid inputs are provided for the transaction ID or choice.
         """
 
         transaction_id = int(input('Type the transaction_id to update the transaction. '))
-        if db.check_if_eligible(user_id, transaction_id):
-            print('What information would you like to update? ')
-            print('[1] Amount [2] Description. ')
-            while True:
-                try:
-                    user_choice = int(input('Type 1 or 2: '))
-                    if user_choice not in [1, 2]:
-                        raise ValueError
-                except ValueError:
-                    print('Invalid choice. Please choose [1] Amount or [2] Description.')
-                    continue
-                if user_choice == 1:
-                    amount = self.get_amount()
-                    db.update_amount_of_transaction(amount, transaction_id)
-                    break
-                elif user_choice == 2:
-                    description = self.get_description()
-                    db.update_description_of_transaction(description, transaction_id)
-                    break
+        print('What information would you like to update? ')
+        print('[1] Amount [2] Description [3] Both. ')
+        while True:
+            try:
+                user_choice = int(input('Type 1, 2 or 3: '))
+                if user_choice not in [1, 2, 3]:
+                    raise ValueError
+            except ValueError:
+                print('Invalid choice. Please choose [1] Amount, [2] Description or [3] Both.')
+                continue
+            if user_choice == 1:
+                amount = self.get_amount()
+                updated = db.update_amount_of_transaction(amount, transaction_id, user_id)
+            elif user_choice == 2:
+                description = self.get_description()
+                updated = db.update_description_of_transaction(description, transaction_id, user_id)
+            else:
+                amount = self.get_amount()
+                description = self.get_description()
+                updated = db.update_transaction(transaction_id, user_id, amount=amount, description=description)
+                if updated:
+                    logger.info('Transaction %s updated successfully. ', transaction_id)
+            if updated is False:
+                print('You are not eligible to update this transaction. ')
+            break
 
     @staticmethod
     def get_amount():
@@ -288,30 +749,28 @@ class User:
 
         The function ensures the input is a valid number and greater than zero.
         If the input is invalid, it provides feedback and prompts the user to try again.
+        The input is parsed by `_parse_amount`, which first matches it against `_AMOUNT_RE`, so malformed input
+        (including 'NaN' and 'Infinity') is rejected before `Decimal` sees it. The amount is parsed straight
+        into a `Decimal`, matching the `DECIMAL` column it is stored in, so it is neither rounded through a float
+        nor converted again when sent to the database.
 
         Returns:
-            float: The valid positive transaction amount entered by the user.
-
-        Raises:
-            ValueError: If the input cannot be converted to a float or is non-numeric.
+            Decimal: The valid positive transaction amount entered by the user.
         """
         while True:
             try:
-                amount = float(input('Amount: '))
-                if amount > 0:
-                    return amount
-                else:
-                    print('Amount must be positive.')
-            except ValueError:
-                print('You should type a valid number. ')
+                return _parse_amount(input('Amount: '))
+            except ValueError as e:
+                print(e)
 
     @staticmethod
     def get_category():
         """
         Prompt the user to select a transaction category from a predefined list.
 
-        The function displays a list of categories, validates the user's input,
+        The function displays the list of categories from `CATEGORIES`, validates the user's input,
         and ensures the selection is a valid number corresponding to an available category.
+        The menu is written once, and again only after an invalid choice.
 
         Categories:
             1: Food
@@ -327,26 +786,13 @@ class User:
         Raises:
             ValueError: If the input is not a valid integer.
         """
-        categories = {
-            1: 'Food',
-            2: 'Transportation',
-            3: 'Utilities',
-            4: 'Entertainment',
-            5: 'Health',
-            6: 'Account'
-        }
         while True:
-            print('Select a category: ')
-            for key, value in categories.items():
-                print(f'{key}: {value}')
+            sys.stdout.write(CATEGORY_MENU)
+            sys.stdout.flush()
             try:
-                category = int(input('Select a category: '))
-                if category in categories:
-                    return category
-                    break
-                print('Invalid choice. Please select a valid category.  ')
-            except ValueError:
-                print('You should type a number corresponding to a category. ')
+                return _parse_category(input('Select a category: '))
+            except ValueError as e:
+                print(e)
 
     @staticmethod
     def get_description():
@@ -381,7 +827,7 @@ class User:
                 transaction_date = input('Enter date (YYYY-MM-DD: ')
                 if not transaction_date:
                     return datetime.now()
-                return datetime.strptime(transaction_date, '%Y-%m-%d')
+                return _parse_date(transaction_date)
             except ValueError:
                 print('Invalid date format. Please use YYYY-MM-DD. Try again. ')
 
@@ -402,14 +848,12 @@ class User:
             ValueError: If the input is not a valid integer or not within the allowed options.
         """
         while True:
-            print('Select type of transaction [1] Income [2] Expense: ')
+            sys.stdout.write(TRANSACTION_TYPE_MENU)
+            sys.stdout.flush()
             try:
-                type_of_transaction = int(input('Select number: '))
-                if type_of_transaction in [1, 2]:
-                    return type_of_transaction
-                print('Invalid choice. Please select 1 or 2.')
-            except ValueError:
-                print('You should type a number (1 or 2). ')
+                return _parse_transaction_type(input('Select number: '))
+            except ValueError as e:
+                print(e)
 
     @staticmethod
     def is_valid_date(date_str):
@@ -423,7 +867,7 @@ class User:
             bool: True if the date is in the 'YYYY-MM-DD' format, False otherwise.
         """
         try:
-            valid_date = datetime.strptime(date_str, '%Y-%m-%d')
+            valid_date = _parse_date(date_str)
             return valid_date
         except ValueError:
             return None